@@ -0,0 +1,11 @@
+"""설문 응답 파일 일괄 추천 실행기 (python -m k_career_navigator batch 와 같음)
+
+    python batch_recommend.py cohort.csv -o results.jsonl --workers 8
+"""
+
+import sys
+
+from k_career_navigator.batch import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""K-Career Navigator 핵심 로직: 화면(Streamlit) 없이 import 할 수 있는 데이터·추세 분석·추천 모듈
+
+패키지 자체는 가볍게 유지하고, 아래 공개 이름은 처음 접근할 때 해당 하위 모듈을 불러온다.
+"""
+
+import importlib
+
+# 공개 이름 → 하위 모듈
+_EXPORTS = {
+    "LRUCache": "cache",
+    "dataset_key": "cache",
+    "register_dataset": "cache",
+    "COMPANY_CATALOG": "companies",
+    "CompanyCatalog": "companies",
+    "top_companies": "companies",
+    "METRIC_REGISTRY": "registry",
+    "metric_specs": "registry",
+    "create_dummy_data": "data",
+    "load_csv": "data",
+    "load_dataset": "data",
+    "load_source": "data",
+    "resample_dataset": "data",
+    "upload_cache_key": "data",
+    "validate_dataset": "data",
+    "get_cagr": "trends",
+    "analyze_trends": "trends",
+    "append_year_rows": "trends",
+    "bootstrap_cagr_intervals": "trends",
+    "describe_market": "trends",
+    "forecast_industry": "trends",
+    "lead_lag_summary": "trends",
+    "regime_timeline": "trends",
+    "QuestionBank": "questions",
+    "load_question_bank": "questions",
+    "parse_location": "regions",
+    "build_recommendation_table": "recommend",
+    "generate_recommendation": "recommend",
+    "recommendation_profile": "recommend",
+    "SearchIndex": "search",
+    "search_catalog": "search",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module}", __name__), name)
@@ -0,0 +1,230 @@
+"""설문 응답 CSV/JSONL을 한 번에 처리하는 배치 추천 실행기
+
+    python -m k_career_navigator batch cohort.csv -o results.jsonl --workers 8
+
+입력 행은 SURVEY_FIELDS(industry, sub_industry, status, major, job_role, strength, biz_talk, theory_level)
+컬럼을 가지며, 그 밖의 컬럼(학번 등)은 결과에 그대로 실린다. 산업 추세는 산업별로 한 번만 계산해
+전체 설문 조합 추천 테이블과 함께 워커 프로세스에 나눠 주고, 행은 청크로 묶어 프로세스 풀에서
+조회·직렬화한 뒤 입력 순서대로 기록한다. 선택지 밖 응답은 generate_recommendation으로 직접 계산한다.
+설문 값은 형식과 관계없이 문자열(빈 값은 None)로 맞추며, 목록·객체 값처럼 처리할 수 없는 행은
+error 컬럼에 사유를 적고 표준 오류에 행 번호와 함께 알린 뒤 나머지 행을 계속 처리한다.
+"""
+
+import argparse
+import csv
+import io
+import itertools
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from .data import detect_file_encoding, load_source
+from .recommend import (
+    INDUSTRY_OPTIONS,
+    RESULT_FIELDS,
+    SURVEY_FIELDS,
+    RecommendationTable,
+    build_recommendation_table,
+    generate_recommendation,
+    survey_option_ids,
+)
+from .trends import DEFAULT_TREND_WINDOW, TREND_WINDOWS, analyze_trends, forecast_industry, get_trend_index, window_start_year
+
+DEFAULT_CHUNK_ROWS = 500
+# 결과 행에서 목록 항목을 CSV 한 칸에 담을 때 쓰는 구분자
+LIST_SEPARATOR = " | "
+# 처리하지 못한 행의 사유를 담는 결과 컬럼
+ERROR_FIELD = "error"
+
+_WORKER_TRENDS: Dict[str, Dict[str, Any]] = {}
+_WORKER_TABLE: List[RecommendationTable] = []
+
+
+def load_source_or_exit(path: Optional[str]) -> pd.DataFrame:
+    """산업 통계 로드 (안내는 표준 오류로, 지정한 CSV를 인식하지 못하면 종료)"""
+    try:
+        df, notices = load_source(path)
+    except ValueError as exc:
+        raise SystemExit(str(exc))
+    for _, message in notices:
+        print(message, file=sys.stderr)
+    return df
+
+
+def industry_trends(df: pd.DataFrame, start_year: int) -> Dict[str, Dict[str, Any]]:
+    """산업별 추세 + 전망 (대시보드와 같은 analyze_trends + forecast_industry)"""
+    trends: Dict[str, Dict[str, Any]] = {}
+    for industry in INDUSTRY_OPTIONS:
+        industry_trend = analyze_trends(df, industry, start_year) or {}
+        if industry_trend:
+            industry_trend.update(forecast_industry(df, industry, start_year))
+        trends[industry] = industry_trend
+    return trends
+
+
+def read_surveys(path: str, chunk_rows: int) -> Iterator[List[Dict[str, Any]]]:
+    """설문 CSV/JSONL을 chunk_rows 행씩 dict 목록으로 읽기 (확장자로 형식 판별)"""
+    if path.lower().endswith((".jsonl", ".ndjson")):
+        reader = pd.read_json(path, lines=True, chunksize=chunk_rows, dtype=False)
+    else:
+        enc = detect_file_encoding(path) or "utf-8"
+        reader = pd.read_csv(path, encoding=enc, dtype=str, keep_default_na=False, chunksize=chunk_rows)
+    for chunk in reader:
+        chunk = chunk.astype(object).where(chunk.notna(), None)
+        yield chunk.to_dict(orient="records")
+
+
+def _init_worker(trends: Dict[str, Dict[str, Any]], table: RecommendationTable) -> None:
+    _WORKER_TRENDS.update(trends)
+    _WORKER_TABLE[:] = [table]
+
+
+def survey_from_row(row: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    """입력 행 → 설문 응답 (CSV 경로와 같게 값은 문자열, 빈 값은 None, 목록·객체 값은 ValueError)"""
+    survey: Dict[str, Optional[str]] = {}
+    for field in SURVEY_FIELDS:
+        value = row.get(field)
+        if isinstance(value, (list, dict)):
+            raise ValueError(f"'{field}' 값은 문자열이어야 합니다 ({type(value).__name__})")
+        survey[field] = str(value) if value is not None and value != "" else None
+    return survey
+
+
+def recommend_rows(rows: List[Dict[str, Any]], start: int = 0) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """설문 행 목록 → (입력 컬럼 + 추천 결과 컬럼 행 목록, 처리하지 못한 행 안내) (워커 프로세스에서 실행)
+
+    start는 첫 행의 입력 내 위치(0부터)로, 안내 문구의 행 번호에만 쓴다.
+    """
+    table = _WORKER_TABLE[0]
+    results = []
+    errors = []
+    for offset, row in enumerate(rows):
+        try:
+            survey = survey_from_row(row)
+            option_ids = survey_option_ids(survey)
+            result = table.lookup(option_ids) if option_ids is not None else None
+            if result is None:
+                result = generate_recommendation(_WORKER_TRENDS.get(survey["industry"], {}), survey)
+        except (TypeError, ValueError) as exc:
+            errors.append(f"{start + offset + 1}번째 행을 처리하지 못했습니다: {exc}")
+            result = {ERROR_FIELD: str(exc)}
+        results.append({**row, **result})
+    return results, errors
+
+
+def format_rows(rows: List[Dict[str, Any]], jsonl: bool, columns: Optional[List[str]] = None) -> str:
+    """결과 행을 JSONL 또는 CSV 본문 문자열로 직렬화 (CSV는 columns 순서, 목록은 LIST_SEPARATOR로 연결)"""
+    if jsonl:
+        return "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+    for row in rows:
+        writer.writerow(
+            {key: LIST_SEPARATOR.join(value) if isinstance(value, list) else value for key, value in row.items()}
+        )
+    return buffer.getvalue()
+
+
+def process_chunk(
+    rows: List[Dict[str, Any]], start: int, jsonl: bool, columns: Optional[List[str]]
+) -> Tuple[int, str, List[str]]:
+    """추천 + 직렬화를 워커에서 끝내고 (행 수, 기록할 문자열, 오류 안내)만 돌려준다 (결과 dict를 주고받는 직렬화 비용 절감)"""
+    results, errors = recommend_rows(rows, start)
+    return len(rows), format_rows(results, jsonl, columns), errors
+
+
+def _write_chunk(out, text: str, errors: List[str]) -> None:
+    out.write(text)
+    for message in errors:
+        print(message, file=sys.stderr)
+
+
+def run_batch(
+    input_path: str,
+    out,
+    jsonl: bool = True,
+    data_path: Optional[str] = None,
+    window_label: str = DEFAULT_TREND_WINDOW,
+    workers: Optional[int] = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> int:
+    """배치 실행 후 처리한 행 수 반환 (workers=1이면 프로세스 풀 없이 현재 프로세스에서 처리)"""
+    df = load_source_or_exit(data_path)
+    start_year = window_start_year(window_label, int(get_trend_index(df).years[-1]))
+    trends = industry_trends(df, start_year)
+    table = build_recommendation_table(df, start_year)
+    chunks = read_surveys(input_path, chunk_rows)
+    first = next(chunks, None)
+    if first is None:
+        return 0
+    columns = None
+    if not jsonl:
+        columns = list(first[0]) + [col for col in RESULT_FIELDS + [ERROR_FIELD] if col not in first[0]]
+        csv.DictWriter(out, fieldnames=columns).writeheader()
+    chunks = itertools.chain([first], chunks)
+    workers = workers or os.cpu_count() or 1
+    total = 0
+
+    if workers == 1:
+        _init_worker(trends, table)
+        for rows in chunks:
+            count, text, errors = process_chunk(rows, total, jsonl, columns)
+            _write_chunk(out, text, errors)
+            total += count
+        return total
+
+    # 입력 순서를 지키면서 메모리를 묶어 두기 위해 진행 중인 청크 수를 워커 수의 두 배로 제한한다.
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(trends, table)) as pool:
+        pending: deque = deque()
+        submitted = 0
+        for rows in chunks:
+            pending.append(pool.submit(process_chunk, rows, submitted, jsonl, columns))
+            submitted += len(rows)
+            while len(pending) >= workers * 2 or (pending and pending[0].done()):
+                count, text, errors = pending.popleft().result()
+                _write_chunk(out, text, errors)
+                total += count
+        while pending:
+            count, text, errors = pending.popleft().result()
+            _write_chunk(out, text, errors)
+            total += count
+    return total
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("input", help="설문 응답 CSV 또는 JSONL 파일")
+    parser.add_argument("-o", "--output", help="결과 파일 (.csv 또는 .jsonl, 생략하면 표준 출력에 JSONL)")
+    parser.add_argument("--data", help="산업 통계 CSV (생략하면 기본 공식 CSV 또는 더미 데이터)")
+    parser.add_argument(
+        "--window", default=DEFAULT_TREND_WINDOW, choices=list(TREND_WINDOWS), help="산업 기상도 분석 기간"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="워커 프로세스 수 (기본: CPU 코어 수, 1이면 단일 프로세스)")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS, help="워커에 한 번에 넘기는 행 수")
+
+
+def run(args: argparse.Namespace) -> int:
+    """파싱된 인자로 배치 실행 후 처리 속도를 표준 오류에 보고"""
+    started = time.perf_counter()
+    options = dict(data_path=args.data, window_label=args.window, workers=args.workers, chunk_rows=args.chunk_rows)
+    if args.output:
+        jsonl = not args.output.lower().endswith(".csv")
+        # CSV는 엑셀에서 한글이 깨지지 않도록 BOM을 붙인다.
+        with open(args.output, "w", encoding="utf-8" if jsonl else "utf-8-sig", newline="") as out:
+            total = run_batch(args.input, out, jsonl, **options)
+    else:
+        total = run_batch(args.input, sys.stdout, True, **options)
+    elapsed = time.perf_counter() - started
+    print(f"{total:,}행 처리, {elapsed:.2f}초 ({total / elapsed if elapsed else 0:,.0f}행/초)", file=sys.stderr)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="설문 응답 파일 전체에 대한 K-Career Navigator 추천 일괄 생성")
+    add_arguments(parser)
+    return run(parser.parse_args(argv))
@@ -0,0 +1,64 @@
+"""프로세스 전역 캐시와 데이터셋 버전 키"""
+
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict
+
+import pandas as pd
+
+
+class LRUCache:
+    """프로세스 전역에서 세션 간 공유하는 스레드 안전 LRU 캐시"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[Any, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# id(DataFrame) → 데이터셋 버전 키 (load_data가 캐시 키를 등록, DataFrame이 사라지면 자동 제거)
+_DATASET_KEYS: Dict[int, Any] = {}
+
+
+def register_dataset(df: pd.DataFrame, key: Any) -> None:
+    """DataFrame에 데이터셋 버전 키를 연결 (추세 인덱스 등 파생 캐시의 키로 사용)"""
+    if id(df) not in _DATASET_KEYS:
+        weakref.finalize(df, _DATASET_KEYS.pop, id(df), None)
+    _DATASET_KEYS[id(df)] = key
+
+
+def dataset_key(df: pd.DataFrame) -> Any:
+    """데이터셋 버전 키: 등록된 캐시 키, 없으면 내용 해시"""
+    key = _DATASET_KEYS.get(id(df))
+    if key is not None:
+        return key
+    digest = hashlib.blake2b(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes(), digest_size=16)
+    digest.update(repr(list(df.columns)).encode("utf-8"))
+    return ("content", digest.hexdigest())
+
+
+_MISSING = object()
@@ -0,0 +1,170 @@
+"""명령줄 진입점: python -m k_career_navigator {recommend,batch} ...
+
+도움말·인자 파싱만으로는 pandas/numpy를 불러오지 않도록 분석 모듈은 하위 명령 안에서 import 한다.
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import List, Optional, Sequence
+
+# recommend 하위 명령의 설문 인자 → 설문 항목
+SURVEY_ARGUMENTS = (
+    ("industry", "관심 산업 (예: 반도체)"),
+    ("sub_industry", "세부 분야 (선택지 일부만 써도 됨, 예: 메모리)"),
+    ("status", "준비 상태 (예: 입문, 기본 경험, 포트폴리오)"),
+    ("major", "전공 계열 (예: 전자공학)"),
+    ("job_role", "희망 직무 (예: 공정)"),
+    ("strength", "핵심 강점 (예: 분석적 사고력)"),
+    ("biz_talk", "비즈니스 회화 가능 여부 (가능/불가능)"),
+    ("theory_level", "핵심 개념 이해도 (하/중/상)"),
+)
+
+
+class _Timer:
+    """--timing용 단계별 경과 시간 기록"""
+
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self.started = self.last = time.perf_counter()
+        self.steps: List[tuple] = []
+
+    def mark(self, label: str) -> None:
+        now = time.perf_counter()
+        self.steps.append((label, now - self.last))
+        self.last = now
+
+    def report(self) -> None:
+        if not self.enabled:
+            return
+        for label, seconds in self.steps:
+            print(f"[timing] {label}: {seconds * 1000:.1f} ms", file=sys.stderr)
+        print(f"[timing] 합계: {(self.last - self.started) * 1000:.1f} ms", file=sys.stderr)
+
+
+def resolve_option(value: Optional[str], options: Sequence[str]) -> Optional[str]:
+    """선택지 원문 또는 한 선택지에만 들어 있는 일부 문자열 → 선택지 원문 (못 찾으면 입력값 그대로)"""
+    if value is None or value in options:
+        return value
+    matches = [option for option in options if value in option]
+    return matches[0] if len(matches) == 1 else value
+
+
+def _print_text(result: dict) -> None:
+    sections = [
+        ("산업 기상도", result.get("market_summary")),
+        ("전망", result.get("market_outlook")),
+        ("시기별 조언", result.get("status_tip")),
+        ("직무 × 강점 조언", result.get("core_advice")),
+    ]
+    for title, text in sections:
+        if text:
+            print(f"■ {title}\n{text}\n")
+    lists = (
+        ("보완 조언", result.get("complement_tips")),
+        ("예상 면접 질문", result.get("interview_questions")),
+        ("함께 준비할 관련 질문", result.get("related_questions")),
+    )
+    for title, items in lists:
+        if items:
+            print(f"■ {title}")
+            for i, item in enumerate(items, start=1):
+                print(f"  {i}. {item}")
+            print()
+    if result.get("keywords"):
+        print("■ 키워드\n" + " ".join(f"#{kw}" for kw in result["keywords"]))
+
+
+def cmd_recommend(args: argparse.Namespace) -> int:
+    timer = _Timer(args.timing)
+    from .batch import load_source_or_exit
+    from .recommend import (
+        BIZ_TALK_OPTIONS,
+        INDUSTRY_OPTIONS,
+        JOB_ROLE_OPTIONS,
+        MAJOR_OPTIONS,
+        STATUS_OPTIONS,
+        STRENGTH_OPTIONS,
+        SUB_INDUSTRY_OPTIONS,
+        THEORY_LEVEL_OPTIONS,
+        generate_recommendation,
+        survey_option_ids,
+    )
+    from .trends import DEFAULT_TREND_WINDOW, TREND_WINDOWS, analyze_trends, forecast_industry, get_trend_index, window_start_year
+
+    timer.mark("분석 모듈 import")
+
+    window = args.window or DEFAULT_TREND_WINDOW
+    if window not in TREND_WINDOWS:
+        print(f"분석 기간은 {', '.join(TREND_WINDOWS)} 중 하나여야 합니다.", file=sys.stderr)
+        return 2
+
+    industry = resolve_option(args.industry, INDUSTRY_OPTIONS)
+    options = {
+        "sub_industry": SUB_INDUSTRY_OPTIONS.get(industry, []),
+        "status": STATUS_OPTIONS,
+        "major": MAJOR_OPTIONS,
+        "job_role": JOB_ROLE_OPTIONS,
+        "strength": STRENGTH_OPTIONS,
+        "biz_talk": BIZ_TALK_OPTIONS,
+        "theory_level": THEORY_LEVEL_OPTIONS,
+    }
+    survey = {"industry": industry, "industry_prefix": industry}
+    survey.update({field: resolve_option(getattr(args, field), choices) for field, choices in options.items()})
+    if survey_option_ids(survey) is None:
+        print("선택지에 없는 응답이 있어 규칙을 직접 평가합니다 (가능한 값은 --help 참고).", file=sys.stderr)
+
+    df = load_source_or_exit(args.data)
+    timer.mark("데이터 로드")
+
+    start_year = window_start_year(window, int(get_trend_index(df).years[-1]))
+    trends = analyze_trends(df, industry, start_year)
+    if not trends:
+        print(f"선택한 기간({window})의 데이터가 충분하지 않아 분석이 어렵습니다.", file=sys.stderr)
+        return 1
+    trends.update(forecast_industry(df, industry, start_year))
+    result = generate_recommendation(trends, survey)
+    timer.mark("추세 분석 + 추천")
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        _print_text(result)
+    timer.report()
+    return 0
+
+
+def cmd_batch(args: argparse.Namespace) -> int:
+    from .batch import run
+
+    return run(args)
+
+
+def build_parser(with_batch: bool = False) -> argparse.ArgumentParser:
+    """명령줄 파서 (batch 인자 정의는 batch 모듈에 있으므로 with_batch일 때만 불러온다)"""
+    parser = argparse.ArgumentParser(prog="python -m k_career_navigator", description="K-Career Navigator 명령줄 도구")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    recommend = subparsers.add_parser("recommend", help="설문 응답 하나에 대한 맞춤 추천 출력")
+    for field, help_text in SURVEY_ARGUMENTS:
+        recommend.add_argument("--" + field.replace("_", "-"), dest=field, required=field == "industry", help=help_text)
+    recommend.add_argument("--window", help="산업 기상도 분석 기간 (예: 최근 5년, 기본: 2020년 이후)")
+    recommend.add_argument("--data", help="산업 통계 CSV (생략하면 기본 공식 CSV 또는 더미 데이터)")
+    recommend.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    recommend.add_argument("--timing", action="store_true", help="import·로드·분석 단계별 소요 시간을 표준 오류에 출력")
+    recommend.set_defaults(handler=cmd_recommend)
+
+    batch = subparsers.add_parser("batch", help="설문 응답 파일 전체 일괄 추천")
+    if with_batch:
+        from .batch import add_arguments
+
+        add_arguments(batch)
+    batch.set_defaults(handler=cmd_batch)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    args = build_parser(with_batch=argv[:1] == ["batch"]).parse_args(argv)
+    return args.handler(args)
@@ -0,0 +1,349 @@
+"""기업 카탈로그: 기업 정보 + 설문 매칭용 속성(계층·지역·전공·어학·직무) 역색인과 맞춤 기업 순위"""
+
+import heapq
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .regions import ANY_REGION, COMMUTE_ZONES, Site, commute_zone, parse_location
+
+# 카탈로그 계층 (화면 표시 순서): (계층, 제목, 설명)
+COMPANY_TIERS = [
+    ("Tier 1", "■ [Tier 1] 반도체 종합 기업 (IDM / 파운드리)", "산업의 심장 역할을 하는 종합 반도체 기업들입니다."),
+    ("Tier 1.5", "■ [Tier 1.5] 팹리스 (설계 전문)", "수도권 R&D 중심, 설계/임베디드 직무 비중이 높습니다."),
+    ("Tier 2", "■ [Tier 2] OSAT (패키징/테스트)", "충청권 중심의 후공정/패키징 알짜 기업입니다."),
+    ("Global", "■ [Global] 외국계 장비사", "연봉 상위권, 영어와 글로벌 커뮤니케이션 역량이 중요합니다."),
+    ("Hidden Champion", "■ [Hidden Champion] 국내 소부장 (장비/소재)", "높은 성장성과 기술력을 가진 중견 장비·소재 기업입니다."),
+]
+
+# 어학 요구 수준: 무관 < 기본(어학 점수 기준만) < 우대 < 필수(영어 회화·면접)
+LANGUAGE_LEVELS = ("무관", "기본", "우대", "필수")
+
+# 기업 레코드: 화면 표시 항목(한글 키) + 설문 매칭 속성(tier/majors/language/roles, 값은 설문 선택지 원문)
+# 근무 지역은 '위치' 문구를 카탈로그 생성 시 regions.parse_location으로 해석해 색인한다.
+COMPANIES: List[Dict[str, Any]] = [
+    {
+        "기업": "삼성전자 (DS부문)",
+        "주력": "메모리(DRAM, NAND), 파운드리, 시스템LSI",
+        "위치": "경기 화성(DSR/Line), 평택(고덕), 기흥(파운드리), 용인(남사-예정)",
+        "스펙": "학점 3.5+ (전공평점 중요) / 오픽 IM2(이공), IH(인문) / GSAT 통과 필수",
+        "Tip": "설비/공정은 평택 근무 가능성 높음. 메모리사업부가 채용 규모 가장 큼.",
+        "링크": "https://www.samsungcareers.com/",
+        "tier": "Tier 1",
+        "majors": ("전자공학", "재료/화학공학", "컴퓨터공학/SW", "기계공학", "산업공학", "상경/인문계열"),
+        "language": "기본",
+        "roles": ("R&D(회로/설계)", "R&D(소자/재료)", "공정/제조/설비", "품질/수율(QA)", "경영/기획/전략", "영업/마케팅/CS"),
+    },
+    {
+        "기업": "삼성전자 (TSP총괄)",
+        "주력": "반도체 패키징 및 테스트 (후공정)",
+        "위치": "충남 천안(성성동), 온양(배방읍)",
+        "스펙": "패키징 공정 이해도 필수 / 기계, 재료, 화공 전공 선호 / 지방 근무 가능자",
+        "Tip": "'천안/온양' 근무로, 수도권 대비 경쟁률이 소폭 낮을 수 있음. (알짜 직무)",
+        "링크": "https://www.samsungcareers.com/",
+        "tier": "Tier 1",
+        "majors": ("기계공학", "재료/화학공학"),
+        "language": "기본",
+        "roles": ("R&D(소자/재료)", "공정/제조/설비", "품질/수율(QA)"),
+    },
+    {
+        "기업": "SK하이닉스",
+        "주력": "메모리 (DRAM 세계 2위, NAND)",
+        "위치": "경기 이천(부발읍 - 본사/DRAM), 충북 청주(흥덕구 - NAND), 용인(원삼-예정)",
+        "스펙": "학점 3.5+ / SKCT 난이도 최상 / '직무 면접'이 매우 깊이 있음 (전공 지식)",
+        "Tip": "청주 사업장(NAND/Solution) 지원 시 경쟁률 측면에서 전략적일 수 있음.",
+        "링크": "https://recruit.skhynix.com/servlet/mnus_main.view",
+        "tier": "Tier 1",
+        "majors": ("전자공학", "재료/화학공학", "컴퓨터공학/SW", "기계공학", "산업공학"),
+        "language": "기본",
+        "roles": ("R&D(회로/설계)", "R&D(소자/재료)", "공정/제조/설비", "품질/수율(QA)"),
+    },
+    {
+        "기업": "DB하이텍",
+        "주력": "8인치 파운드리 (아날로그 반도체, PMIC)",
+        "위치": "경기 부천(원미구 - 본사/Fab1), 충북 음성(감곡면 - Fab2)",
+        "스펙": "학점 3.3~3.5 / 반도체 소자 및 공정 지식 / 전자공학 선호",
+        "Tip": "연봉 상승률 높음. 부천 근무 선호도가 높으나 음성 공장 T/O도 많음.",
+        "링크": "https://dbgroup.recruiter.co.kr/",
+        "tier": "Tier 1",
+        "majors": ("전자공학", "재료/화학공학"),
+        "language": "무관",
+        "roles": ("R&D(회로/설계)", "R&D(소자/재료)", "공정/제조/설비", "품질/수율(QA)"),
+    },
+    {
+        "기업": "LX세미콘",
+        "주력": "디스플레이 구동칩(DDI) 설계 (국내 1위)",
+        "위치": "서울 양재, 대전 유성구 (R&D 캠퍼스)",
+        "스펙": "전자/컴공 석사 선호 / Verilog, FPGA 역량 / 학사 지원 시 프로젝트 필수",
+        "링크": "https://www.lxsemicon.com/kr/company/recruitment-information/application",
+        "tier": "Tier 1.5",
+        "majors": ("전자공학", "컴퓨터공학/SW"),
+        "language": "무관",
+        "roles": ("R&D(회로/설계)",),
+    },
+    {
+        "기업": "텔레칩스 / 칩스앤미디어",
+        "주력": "차량용 인포테인먼트(IVI) / 비디오 IP",
+        "위치": "경기 성남(판교), 서울 강남",
+        "스펙": "C/C++, 임베디드 SW, 디지털 논리회로 이해도 / 시스템 반도체 교육 우대",
+        "링크": "https://careers.telechips.com/",
+        "tier": "Tier 1.5",
+        "majors": ("전자공학", "컴퓨터공학/SW"),
+        "language": "무관",
+        "roles": ("R&D(회로/설계)",),
+    },
+    {
+        "기업": "하나마이크론",
+        "주력": "반도체 패키징 및 테스트 (삼성/SK 협력)",
+        "위치": "충남 아산(음봉면), 경기 판교(R&D)",
+        "스펙": "전기/전자/기계/재료 / 품질(QC/QA) 직무 T/O 많음",
+        "링크": "https://hanamicron.recruiter.co.kr/career/home",
+        "tier": "Tier 2",
+        "majors": ("전자공학", "기계공학", "재료/화학공학"),
+        "language": "무관",
+        "roles": ("공정/제조/설비", "품질/수율(QA)"),
+    },
+    {
+        "기업": "SFA반도체",
+        "주력": "반도체 조립 및 테스트",
+        "위치": "충남 천안(서북구)",
+        "스펙": "학점 3.2~3.5 / 3교대 근무 가능자(엔지니어 일부) / 오픽 IM1+",
+        "링크": "https://recruit.sfa.co.kr/",
+        "tier": "Tier 2",
+        "majors": ("전자공학", "기계공학", "산업공학"),
+        "language": "기본",
+        "roles": ("공정/제조/설비", "품질/수율(QA)"),
+    },
+    {
+        "기업": "네패스 (Nepes)",
+        "주력": "WLP, PLP (첨단 패키징)",
+        "위치": "충북 청주(오창), 괴산(청안)",
+        "스펙": "화학/신소재 선호 / 차세대 패키징 기술 관심도 / 영어 독해 능력",
+        "링크": "https://careers.nepes.co.kr/",
+        "tier": "Tier 2",
+        "majors": ("재료/화학공학",),
+        "language": "기본",
+        "roles": ("R&D(소자/재료)", "공정/제조/설비"),
+    },
+    {
+        "기업": "ASML Korea",
+        "주력": "EUV 노광 장비 (슈퍼을)",
+        "위치": "경기 화성(동탄), 평택, 이천, 청주 (고객사 팹 내부 상주)",
+        "스펙": "[필수] 영어 회화(OPIc IM3~IH) / 전자회로, 기구학 / CS는 교대 근무 있음",
+        "Tip": "서류-AI역검-영어Test-면접 순. 영어 면접 대비 필수.",
+        "링크": "https://midasin-asmlkorea.recruiter.co.kr/career/home",
+        "tier": "Global",
+        "majors": ("전자공학", "기계공학"),
+        "language": "필수",
+        "roles": ("공정/제조/설비", "영업/마케팅/CS"),
+    },
+    {
+        "기업": "AMAT / Lam / TEL",
+        "주력": "증착/식각/트랙 장비 (세계 점유율 1~3위)",
+        "위치": "경기 화성, 평택, 이천, 용인(R&D센터)",
+        "스펙": "직무 관련 경험(인턴, 장비 분해조립) / 운전면허(CS) 필수",
+        "Tip": "R&D 센터(용인/화성) 설립으로 석/박사 공정 엔지니어 채용 증가 중.",
+        "링크": "https://www.peoplenjob.com/",
+        "tier": "Global",
+        "majors": ("전자공학", "기계공학", "재료/화학공학"),
+        "language": "우대",
+        "roles": ("R&D(소자/재료)", "공정/제조/설비", "영업/마케팅/CS"),
+    },
+    {
+        "기업": "세메스 (SEMES)",
+        "주력": "세정/식각/포토 장비 (삼성전자 자회사)",
+        "위치": "충남 천안(직산 - 본사), 경기 화성",
+        "스펙": "삼성전자 수준의 복지 / 학점 3.5+ / 기계, 전기전자, SW 전공",
+        "링크": "https://www.semes.com/",
+        "tier": "Hidden Champion",
+        "majors": ("기계공학", "전자공학", "컴퓨터공학/SW"),
+        "language": "무관",
+        "roles": ("R&D(회로/설계)", "공정/제조/설비", "품질/수율(QA)"),
+    },
+    {
+        "기업": "HPSP",
+        "주력": "고압 수소 어닐링 장비 (세계 유일 기술)",
+        "위치": "경기 화성(동탄)",
+        "스펙": "최근 급성장 중 / 기계설계, 공정 엔지니어 / 외국어 가능자 우대",
+        "링크": "https://thehpsp.com/ko/bbs/board.php?bo_table=career",
+        "tier": "Hidden Champion",
+        "majors": ("기계공학", "재료/화학공학"),
+        "language": "우대",
+        "roles": ("R&D(소자/재료)", "공정/제조/설비", "영업/마케팅/CS"),
+    },
+    {
+        "기업": "솔브레인 / 동진쎄미켐",
+        "주력": "식각액 / 포토레지스트 (PR)",
+        "위치": "경기 판교(R&D), 충남 공주(솔브레인), 경기 화성(동진)",
+        "스펙": "화학공학, 신소재 전공 필수 / 위험물산업기사, 화공기사 우대",
+        "링크": "https://www.soulbrain.co.kr/m64.php?tab=1",
+        "tier": "Hidden Champion",
+        "majors": ("재료/화학공학",),
+        "language": "무관",
+        "roles": ("R&D(소자/재료)", "공정/제조/설비", "품질/수율(QA)"),
+    },
+]
+
+# 세부 분야 → 우선 추천 계층 (디스플레이 패널 분야는 계층 가점 없음)
+SUB_INDUSTRY_TIERS: Dict[str, Tuple[str, ...]] = {
+    "메모리(HBM,DRAM)": ("Tier 1", "Tier 2"),
+    "시스템 반도체(파운드리,팹리스)": ("Tier 1", "Tier 1.5"),
+    "소자/재료/장비": ("Global", "Hidden Champion"),
+}
+
+# 맞춤 기업 점수 가중치 (일치한 속성마다 더한다)
+COMPANY_SCORE_WEIGHTS = {
+    "roles": 3.0,
+    "majors": 2.0,
+    "tier": 1.5,
+    "language_fit": 1.0,  # 비즈니스 회화 가능 + 어학 우대/필수 기업
+    "language_gap": -2.0,  # 비즈니스 회화 불가능 + 어학 필수 기업
+}
+DEFAULT_TOP_COMPANIES = 5
+
+_INDEXED_FACETS = ("tier", "majors", "language", "roles")
+_REGION_FACETS = ("zones", "provinces", "cities")
+
+
+def city_label(site: Site) -> str:
+    """Site → 시/군/구 색인 키 ('경기 화성', 시/군/구가 없으면 시/도)"""
+    return f"{site.province} {site.city}" if site.city else site.province
+
+
+class CompanyCatalog:
+    """기업 레코드 목록 + 속성값별 기업 번호 역색인
+
+    설문 속성(tier/majors/language/roles)과 '위치'를 해석한 지역 계층(zones/provinces/cities)을 함께 색인한다.
+    순위 계산은 설문에서 고른 속성값의 게시 목록(posting list)만 훑어 점수를 더하므로
+    카탈로그 전체 크기가 아니라 일치하는 기업 수에 비례한다.
+    """
+
+    def __init__(self, records: Iterable[Dict[str, Any]]):
+        self.records: List[Dict[str, Any]] = list(records)
+        self.sites: List[List[Site]] = [parse_location(record.get("위치")) for record in self.records]
+        postings: Dict[str, Dict[str, List[int]]] = {
+            facet: defaultdict(list) for facet in _INDEXED_FACETS + _REGION_FACETS
+        }
+        for company_id, record in enumerate(self.records):
+            for facet in _INDEXED_FACETS:
+                values = record.get(facet, ())
+                for value in (values,) if isinstance(values, str) else values:
+                    postings[facet][value].append(company_id)
+            regions = {
+                "zones": [commute_zone(site.province) for site in self.sites[company_id]],
+                "provinces": [site.province for site in self.sites[company_id]],
+                "cities": [city_label(site) for site in self.sites[company_id]],
+            }
+            for facet, values in regions.items():
+                for value in dict.fromkeys(values):
+                    postings[facet][value].append(company_id)
+        self.index: Dict[str, Dict[str, Tuple[int, ...]]] = {
+            facet: {value: tuple(ids) for value, ids in by_value.items()} for facet, by_value in postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def ids_for(self, facet: str, value: str) -> Tuple[int, ...]:
+        """속성값에 해당하는 기업 번호 (카탈로그 순서)"""
+        return self.index.get(facet, {}).get(value, ())
+
+    def by_tier(self, tier: str) -> List[Dict[str, Any]]:
+        return [self.records[company_id] for company_id in self.ids_for("tier", tier)]
+
+    def cities_in_zone(self, zone: str) -> List[str]:
+        """통근권 안의 시/군/구 (사업장이 있는 기업 수 내림차순, 동률이면 이름순)"""
+        provinces = COMMUTE_ZONES.get(zone, ())
+        cities = [city for city in self.index["cities"] if city.split(" ")[0] in provinces]
+        return sorted(cities, key=lambda city: (-len(self.index["cities"][city]), city))
+
+    def region_ids(self, zone: Optional[str], cities: Optional[Sequence[str]] = None) -> Optional[Set[int]]:
+        """희망 지역 → 해당 지역에 사업장이 있는 기업 번호 (시/군/구를 고르면 그 합집합, 지역 무관이면 None)"""
+        if cities:
+            return {company_id for city in cities for company_id in self.ids_for("cities", city)}
+        if zone and zone != ANY_REGION:
+            return set(self.ids_for("zones", zone))
+        return None
+
+    def sites_in(self, company_id: int, zone: Optional[str], cities: Optional[Sequence[str]] = None) -> List[Site]:
+        """기업 사업장 중 희망 지역에 속한 곳 (지역 무관이면 전체)"""
+        sites = self.sites[company_id]
+        if cities:
+            return [site for site in sites if city_label(site) in cities]
+        if zone and zone != ANY_REGION:
+            return [site for site in sites if commute_zone(site.province) == zone]
+        return list(sites)
+
+    def group_by_city(self, zone: str, cities: Optional[Sequence[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """희망 지역의 시/군/구별 기업 목록 (색인 조회, 시/군/구 순서는 cities_in_zone)"""
+        selected = list(cities) if cities else self.cities_in_zone(zone)
+        return {city: [self.records[company_id] for company_id in self.ids_for("cities", city)] for city in selected}
+
+    def _survey_terms(self, survey: Dict[str, Any]) -> List[Tuple[str, str, float]]:
+        """설문 응답 → 점수에 반영할 (속성, 값, 가중치) 목록"""
+        weights = COMPANY_SCORE_WEIGHTS
+        terms: List[Tuple[str, str, float]] = []
+        if survey.get("job_role"):
+            terms.append(("roles", survey["job_role"], weights["roles"]))
+        if survey.get("major"):
+            terms.append(("majors", survey["major"], weights["majors"]))
+        for tier in SUB_INDUSTRY_TIERS.get(survey.get("sub_industry"), ()):
+            terms.append(("tier", tier, weights["tier"]))
+        if survey.get("biz_talk") == "가능":
+            terms += [("language", level, weights["language_fit"]) for level in ("우대", "필수")]
+        elif survey.get("biz_talk") == "불가능":
+            terms.append(("language", "필수", weights["language_gap"]))
+        return terms
+
+    def rank(self, survey: Dict[str, Any], k: int = DEFAULT_TOP_COMPANIES) -> List[Dict[str, Any]]:
+        """설문 응답에 맞는 상위 k개 기업 (점수 내림차순, 동점이면 카탈로그 순서)
+
+        반환 항목: {"company": 기업 레코드, "score": 점수, "reasons": 일치한 속성 설명 목록, "sites": 희망 지역 사업장}
+        희망 지역(preferred_region / preferred_cities)을 고르면 그 지역에 사업장이 있는 기업만 남긴다.
+        점수가 0 이하인 기업(일치 속성 없음, 어학 감점만 있음)은 제외한다.
+        """
+        zone, cities = survey.get("preferred_region"), survey.get("preferred_cities")
+        allowed = self.region_ids(zone, cities)
+        scores: Dict[int, float] = defaultdict(float)
+        matched: Dict[int, List[Tuple[str, str, float]]] = defaultdict(list)
+        for facet, value, weight in self._survey_terms(survey):
+            for company_id in self.ids_for(facet, value):
+                scores[company_id] += weight
+                matched[company_id].append((facet, value, weight))
+
+        top = heapq.nlargest(
+            k,
+            (
+                (score, -company_id)
+                for company_id, score in scores.items()
+                if score > 0 and (allowed is None or company_id in allowed)
+            ),
+        )
+        return [
+            {
+                "company": self.records[-neg_id],
+                "score": score,
+                "reasons": [_match_reason(*term) for term in matched[-neg_id]],
+                "sites": self.sites_in(-neg_id, zone, cities),
+            }
+            for score, neg_id in top
+        ]
+
+
+def _match_reason(facet: str, value: str, weight: float) -> str:
+    if facet == "roles":
+        return f"희망 직무({value}) 채용"
+    if facet == "majors":
+        return f"{value} 전공 선호"
+    if facet == "tier":
+        return f"관심 분야 주력 계층({value})"
+    if weight < 0:
+        return "영어 회화 필수 (보완 필요)"
+    return "영어 회화 필수 - 회화 역량이 강점" if value == "필수" else "외국어 가능자 우대"
+
+
+COMPANY_CATALOG = CompanyCatalog(COMPANIES)
+
+
+def top_companies(survey: Dict[str, Any], k: int = DEFAULT_TOP_COMPANIES) -> List[Dict[str, Any]]:
+    """기본 카탈로그에서 설문 응답 맞춤 상위 k개 기업"""
+    return COMPANY_CATALOG.rank(survey, k)
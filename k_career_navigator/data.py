@@ -0,0 +1,757 @@
+"""산업 통계 CSV 로드·정규화·품질 점검 및 주기 변환 (화면 의존성 없음)"""
+
+import codecs
+import hashlib
+import json
+import os
+import re
+import tempfile
+import unicodedata
+import warnings
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .cache import LRUCache, _MISSING, dataset_key, register_dataset
+from .registry import METRIC_REGISTRY, TREND_COLUMNS, _is_flow_column
+
+
+def create_dummy_data() -> pd.DataFrame:
+    """CSV 업로드가 없을 경우 사용할 더미 데이터 생성"""
+    years = list(range(2016, 2025))
+
+    np.random.seed(42)
+    data = {
+        "연도": years,
+        # 반도체
+        "반도체_생산(조원)": np.linspace(250, 420, len(years))
+        + np.random.normal(0, 8, len(years)),
+        "반도체_시장점유율(퍼센트)": np.linspace(16, 20, len(years))
+        + np.random.normal(0, 0.4, len(years)),
+        "반도체_수출(억불)": np.linspace(800, 1180, len(years))
+        + np.random.normal(0, 25, len(years)),
+        "DRAM_가격(달러)": np.linspace(3.0, 4.5, len(years))
+        + np.random.normal(0, 0.2, len(years)),
+        # 디스플레이
+        "디스플레이_생산(조원)": np.linspace(90, 110, len(years))
+        + np.random.normal(0, 3, len(years)),
+        "디스플레이_시장점유율(퍼센트)": np.linspace(30, 28, len(years))
+        + np.random.normal(0, 0.3, len(years)),
+        "디스플레이_수출(억불)": np.linspace(350, 320, len(years))
+        + np.random.normal(0, 10, len(years)),
+        "액정표시장치(LCD)_평균가격(달러)": np.linspace(1.2, 0.7, len(years))
+        + np.random.normal(0, 0.05, len(years)),
+    }
+    df = pd.DataFrame(data).set_index("연도")
+    return df
+
+
+# CSV 값의 소수 자릿수가 이 이하이고 float32로 줄여도 그 자릿수로 반올림한 값이 그대로면 float32로 저장
+FLOAT32_MAX_DECIMALS = 6
+
+
+def parse_numeric(col: pd.Series) -> pd.Series:
+    """천 단위 쉼표·공백이 섞인 문자열 컬럼을 벡터화로 숫자 변환"""
+    if pd.api.types.is_numeric_dtype(col):
+        return col
+    cleaned = col.astype(str).str.replace(",", "", regex=False).str.strip()
+    return pd.to_numeric(cleaned, errors="coerce")
+
+
+def _decimal_places(values: np.ndarray) -> Optional[int]:
+    """유효값이 모두 d자리 소수로 표현되는 가장 작은 d (FLOAT32_MAX_DECIMALS 이하에서 없으면 None)"""
+    finite = values[np.isfinite(values)]
+    for decimals in range(FLOAT32_MAX_DECIMALS + 1):
+        if np.allclose(finite, np.round(finite, decimals), rtol=1e-12, atol=0):
+            return decimals
+    return None
+
+
+def _compact_float(col: pd.Series) -> pd.Series:
+    """float32로 줄여도 원래 소수 자릿수의 값을 그대로 되살릴 수 있으면 float32, 아니면 float64로 변환
+
+    float32의 상대 반올림 오차(약 6e-8)는 작지만, 큰 값의 소수 자리(예: 12,345,678.5)는 잃을 수 있으므로
+    값의 소수 자릿수로 반올림했을 때 원래 값과 같은지로 판정한다. 계산으로 만들어진 값(자릿수 없음)은 float64로 둔다.
+    """
+    values = col.to_numpy(dtype=np.float64, na_value=np.nan)
+    decimals = _decimal_places(values)
+    if decimals is not None and not np.any(np.abs(values[np.isfinite(values)]) > np.finfo(np.float32).max):
+        narrowed = values.astype(np.float32)
+        if np.array_equal(np.round(narrowed.astype(np.float64), decimals), np.round(values, decimals), equal_nan=True):
+            return pd.Series(narrowed, index=col.index, name=col.name)
+    return pd.Series(values, index=col.index, name=col.name)
+
+
+def _compact_year_index(index: pd.Index) -> pd.Index:
+    """정수 연도로만 이루어진 인덱스를 int16으로 축소"""
+    years = index.to_numpy(dtype=np.float64)
+    info = np.iinfo(np.int16)
+    if len(years) and (
+        np.all(np.mod(years, 1) == 0) and years.min() >= info.min and years.max() <= info.max
+    ):
+        return pd.Index(years.astype(np.int16), name="연도")
+    return pd.Index(years, name="연도")
+
+
+# 월/분기 단위 CSV의 기간 키: '연도'+'월', '연도'+'분기' 컬럼 또는 '2024-01', '2024Q1', '2024년 1분기' 형식 문자열
+PERIOD_KEY_COLUMNS = ["연도", "연월", "기간"]
+_MONTH_PATTERN = r"^\s*(\d{4})\s*(?:[-./]|년)?\s*(\d{1,2})\s*월?\s*$"
+_QUARTER_PATTERN = r"^\s*(\d{4})\s*(?:[-./]|년)?\s*(?:[Qq]\s*([1-4])|([1-4])\s*(?:분기|[Qq]))\s*$"
+
+
+def _periods_from_fields(years: pd.Series, subs: pd.Series, freq: str) -> pd.PeriodIndex:
+    """연도·월(또는 분기) 번호로 PeriodIndex 생성 (범위를 벗어나거나 결측인 행은 NaT)"""
+    limit = 12 if freq == "M" else 4
+    valid = (years.notna() & subs.between(1, limit)).to_numpy()
+    field = "month" if freq == "M" else "quarter"
+    periods = pd.PeriodIndex.from_fields(
+        year=years.where(valid, 2000).astype(int).to_numpy(),
+        **{field: subs.where(valid, 1).astype(int).to_numpy()},
+        freq=freq,
+    )
+    return pd.PeriodIndex(periods.where(valid), name="기간")
+
+
+def _period_key(df: pd.DataFrame) -> Optional[Tuple[pd.Index, List[str]]]:
+    """기간 키 컬럼을 원래 주기의 인덱스(연: 연도 숫자, 월/분기: PeriodIndex)로 변환해 (인덱스, 사용한 컬럼) 반환"""
+    if "연도" in df.columns and ("월" in df.columns or "분기" in df.columns):
+        sub_col, freq = ("월", "M") if "월" in df.columns else ("분기", "Q")
+        years = pd.to_numeric(df["연도"], errors="coerce")
+        subs = pd.to_numeric(df[sub_col].astype(str).str.extract(r"(\d{1,2})", expand=False), errors="coerce")
+        return _periods_from_fields(years, subs, freq), ["연도", sub_col]
+
+    for col in PERIOD_KEY_COLUMNS:
+        if col not in df.columns:
+            continue
+        key = df[col]
+        present = key.notna()
+        if present.any() and not pd.api.types.is_numeric_dtype(key):
+            text = key.astype(str)
+            month = text.str.extract(_MONTH_PATTERN)
+            months = pd.to_numeric(month[1], errors="coerce")
+            if months[present].between(1, 12).all():
+                return _periods_from_fields(pd.to_numeric(month[0]), months, "M"), [col]
+            quarter = text.str.extract(_QUARTER_PATTERN)
+            quarters = pd.to_numeric(quarter[1].fillna(quarter[2]), errors="coerce")
+            if quarters[present].notna().all():
+                return _periods_from_fields(pd.to_numeric(quarter[0]), quarters, "Q"), [col]
+        if col == "연도":
+            return pd.Index(pd.to_numeric(key, errors="coerce"), name="연도"), [col]
+    return None
+
+
+# 로버스트 z-점수(MAD 기반)가 이 값을 넘는 전년 대비 변화는 이상치로 표시
+OUTLIER_MAD_Z = 3.5
+# 변화량 척도의 하한 (컬럼 값 중앙값 대비 비율): 거의 일정한 시계열에서 미세한 변화까지 이상치로 잡지 않게 한다.
+OUTLIER_MIN_SCALE = 0.05
+
+
+def validate_dataset(df: pd.DataFrame, non_numeric: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+    """정규화된 DataFrame의 품질 리포트: 누락·중복 기간, 컬럼별 비숫자·결측·음수·이상치 셀 수
+
+    모든 컬럼을 하나의 float64 배열로 올려 마스크 연산으로 한 번에 센다. 이상치는 추세 자체가 걸리지 않도록
+    값이 아니라 직전 행 대비 변화량의 MAD 로버스트 z-점수로 판정한다.
+    """
+    values = df.to_numpy(dtype=np.float64, na_value=np.nan)
+    missing = np.isnan(values)
+    with np.errstate(invalid="ignore"):
+        negative = values < 0
+
+    diffs = np.diff(values, axis=0)
+    outliers = np.zeros(values.shape[1], dtype=np.int64)
+    if len(diffs) >= 3:
+        with np.errstate(invalid="ignore", divide="ignore"), warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            median = np.nanmedian(diffs, axis=0)
+            deviation = np.abs(diffs - median)
+            mad = np.nanmedian(deviation, axis=0)
+            # 변화량 절반 이상이 같으면 MAD가 0이 되므로 평균 절대편차로 척도를 대신하되,
+            # 판정 대상 변화 자체가 척도를 부풀리지 않도록 그 변화를 뺀(leave-one-out) 평균을 쓴다.
+            n_valid = np.sum(~np.isnan(deviation), axis=0)
+            loo_mean = (np.nansum(deviation, axis=0) - deviation) / (n_valid - 1)
+            scale = np.where(mad > 0, mad / 0.6745, loo_mean * 1.2533)
+            scale = np.fmax(scale, OUTLIER_MIN_SCALE * np.abs(np.nanmedian(values, axis=0)))
+            robust_z = deviation / scale
+        outliers = np.sum((robust_z > OUTLIER_MAD_Z) & (scale > 0), axis=0)
+
+    index = df.index
+    duplicated = index[index.duplicated()].unique()
+    if isinstance(index, pd.PeriodIndex):
+        present = np.unique(index.asi8)
+        full = np.arange(present.min(), present.max() + 1) if len(present) else present
+        missing_periods = pd.PeriodIndex.from_ordinals(np.setdiff1d(full, present), freq=index.freq)
+    else:
+        present = np.unique(np.asarray(index, dtype=np.int64)) if len(index) else np.array([], dtype=np.int64)
+        full = np.arange(present.min(), present.max() + 1) if len(present) else present
+        missing_periods = np.setdiff1d(full, present)
+
+    non_numeric = non_numeric or {}
+    columns = {
+        str(col): {
+            "non_numeric": int(non_numeric.get(col, 0)),
+            "missing": int(n_missing),
+            "negative": int(n_negative),
+            "outliers": int(n_outliers),
+        }
+        for col, n_missing, n_negative, n_outliers in zip(
+            df.columns, missing.sum(axis=0), negative.sum(axis=0), outliers
+        )
+    }
+    return {
+        "rows": int(len(df)),
+        "missing_periods": [str(p) for p in missing_periods],
+        "duplicate_periods": [str(p) for p in duplicated],
+        "columns": columns,
+    }
+
+
+def _normalize_with_reason(df: pd.DataFrame) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+    """공통 CSV 후처리: 기간 인덱스(연/분기/월)·필수 컬럼 확인 후 지표 컬럼 수치화/축소, 설명용 컬럼 제거
+
+    (DataFrame, None) 또는 인식하지 못한 이유와 함께 (None, 사유)를 반환한다.
+    """
+    bytes_before = int(df.memory_usage(deep=True).sum())
+    renamed, rejected = match_headers(df.columns)
+    if renamed:
+        df = df.rename(columns=renamed)
+    try:
+        period_key = _period_key(df)
+        if period_key is None:
+            return None, f"기간 컬럼({', '.join(PERIOD_KEY_COLUMNS)}) 중 어느 것도 찾지 못했습니다."
+        index, key_columns = period_key
+        df = df.drop(columns=key_columns)
+        df.index = index
+        df = df[df.index.notna()]
+    except Exception as exc:
+        return None, f"기간 컬럼을 해석하지 못했습니다: {exc}"
+    if df.empty:
+        return None, "유효한 연도/기간 값이 있는 행이 없습니다."
+
+    required_any = [metrics["production"]["column"] for metrics in METRIC_REGISTRY.values()]
+    if not any(col in df.columns for col in required_any):
+        return None, f"필수 생산 지표 컬럼({', '.join(required_any)})이 하나도 없습니다."
+
+    columns: Dict[str, pd.Series] = {}
+    non_numeric: Dict[str, int] = {}
+    for col in df.columns:
+        values = parse_numeric(df[col])
+        n_bad = int(df[col].count() - values.count())
+        # 추세 지표가 아니면서 숫자로 읽히지 않는 값이 섞인 컬럼(비고·출처 등)은 아무도 읽지 않는다.
+        if col not in TREND_COLUMNS and (values.count() == 0 or n_bad):
+            continue
+        columns[col] = _compact_float(values)
+        non_numeric[col] = n_bad
+    if isinstance(df.index, pd.PeriodIndex):
+        df = pd.DataFrame(columns, index=df.index)
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index(kind="stable")
+    else:
+        df = pd.DataFrame(columns, index=_compact_year_index(df.index))
+    df.attrs["memory_report"] = {
+        "bytes_before": bytes_before,
+        "bytes_after": int(df.memory_usage(deep=True).sum()),
+    }
+    df.attrs["validation_report"] = validate_dataset(df, non_numeric)
+    df.attrs["validation_report"]["renamed_columns"] = {str(k): v for k, v in renamed.items()}
+    df.attrs["validation_report"]["rejected_columns"] = {str(k): v for k, v in rejected.items()}
+    return df, None
+
+
+def _normalize_df(df: pd.DataFrame) -> Optional[pd.DataFrame]:
+    """_normalize_with_reason에서 사유를 버린 버전 (인식 실패 시 None)"""
+    return _normalize_with_reason(df)[0]
+
+
+_RESAMPLE_CACHE = LRUCache(16)
+# 원본 주기 → 목표 주기 한 칸에 들어가는 원본 기간 수
+_PERIODS_PER = {("M", "Y"): 12, ("Q", "Y"): 4, ("M", "Q"): 3}
+
+
+def dataset_frequency(df: pd.DataFrame) -> str:
+    """데이터셋 원본 주기: 'Y'(연), 'Q'(분기), 'M'(월)"""
+    if isinstance(df.index, pd.PeriodIndex):
+        return df.index.freqstr.split("-")[0][0]
+    return "Y"
+
+
+def resample_dataset(df: pd.DataFrame, freq: str = "Y") -> Optional[pd.DataFrame]:
+    """월/분기 원본을 연('Y')·분기('Q') 단위로 집계 (데이터셋 버전별 캐시, 원본보다 세밀한 주기는 None)
+
+    유량 지표는 '기간 평균 × 목표 기간당 원본 기간 수'로 합산해 진행 중인 마지막 해/분기도 연율로 환산하고,
+    점유율·가격 등 나머지 지표는 평균한다. 연 단위 결과는 연도(int16) 인덱스라 기존 연 단위 분석에 그대로 쓰인다.
+    """
+    native = dataset_frequency(df)
+    if native == freq:
+        return df
+    if (native, freq) not in _PERIODS_PER:
+        return None
+
+    key = (dataset_key(df), freq)
+    cached = _RESAMPLE_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    if freq == "Y":
+        target = pd.Index(df.index.year, name="연도")
+    else:
+        target = pd.PeriodIndex(df.index.asfreq(freq), name="기간")
+    aggregated = df.groupby(target).mean()
+    flow_cols = [col for col in aggregated.columns if _is_flow_column(col)]
+    aggregated[flow_cols] = aggregated[flow_cols] * _PERIODS_PER[(native, freq)]
+    if freq == "Y":
+        aggregated.index = _compact_year_index(aggregated.index)
+    aggregated = aggregated.astype({col: df[col].dtype for col in aggregated.columns})
+    register_dataset(aggregated, key)
+    _RESAMPLE_CACHE.put(key, aggregated)
+    return aggregated
+
+
+def as_annual(df: pd.DataFrame) -> pd.DataFrame:
+    """연 단위 분석용 DataFrame (월/분기 데이터셋은 캐시된 연 집계)"""
+    return df if dataset_frequency(df) == "Y" else resample_dataset(df, "Y")
+
+
+DEFAULT_DATA_PATH = "산업통상자원부_반도체디스플레이 산업 동향_20241231.csv"
+DATASET_CACHE_MAX_ENTRIES = 8
+# 인코딩 판별에 사용하는 접두부 크기 (CP949는 EUC-KR의 상위 집합이므로 별도로 시도하지 않는다)
+ENCODING_SNIFF_BYTES = 64 * 1024
+# 기본 CSV 옆에 두는 정규화 결과 바이너리 사이드카 (.npz, 형식이 바뀌면 버전을 올린다)
+SIDECAR_SUFFIX = ".npz"
+SIDECAR_FORMAT_VERSION = 6
+
+
+# 연도별 발표본마다 달라지는 헤더(띄어쓰기·괄호·단위 표기)를 표준 컬럼명으로 맞추기 위한 규칙
+# 헤더는 (산업, 지표, 단위)로 나눠 비교한다. 표기 차이만 용서하고, 지표·단위는 별칭표를 거친 뒤 완전히 같아야 한다.
+_HEADER_BRACKETS = str.maketrans("[]{}<>", "()()()")
+_HEADER_SEPARATORS = re.compile(r"[\s_·ㆍ\-]+")
+_HEADER_UNIT = re.compile(r"^(?P<body>.*)\((?P<unit>[^()]*)\)$")
+# 순서대로 치환한다 (억usd → 억달러 → 억불).
+_HEADER_UNIT_ALIASES = (("us$", "달러"), ("usd", "달러"), ("$", "달러"), ("억달러", "억불"), ("%", "퍼센트"))
+_HEADER_METRIC_ALIASES = {"생산액": "생산", "수출액": "수출", "수입액": "수입", "점유율": "시장점유율"}
+# 표준 컬럼에는 없지만 지표로 알아봐야 하는 말 (표준 지표로 잘못 읽히지 않고 거부 사유를 남기도록)
+_HEADER_OTHER_METRICS = ("수입", "출하")
+# 기간 키는 짧아 오매칭 위험이 크므로 별칭 완전 일치로만 맞춘다.
+_PERIOD_HEADER_ALIASES = {
+    "연도": ("년도", "year", "기준연도", "기준년도"),
+    "연월": ("년월", "yearmonth"),
+    "기간": ("period", "시점"),
+    "월": ("month",),
+    "분기": ("quarter",),
+}
+_HEADER_CACHE = LRUCache(32)
+
+
+def _header_key(name: Any) -> str:
+    """비교용 헤더 키: NFKC 정규화, 소문자, 괄호 통일, 공백·구분자 제거"""
+    text = unicodedata.normalize("NFKC", str(name)).lower().translate(_HEADER_BRACKETS)
+    return _HEADER_SEPARATORS.sub("", text)
+
+
+def _header_parts(name: Any) -> Tuple[str, str, str]:
+    """헤더 → (산업, 지표, 단위) 키. 단위는 끝 괄호, 지표는 알려진 지표어 중 가장 긴 접미사 (없으면 빈 문자열)"""
+    key = _header_key(name)
+    match = _HEADER_UNIT.match(key)
+    body, unit = (match.group("body"), match.group("unit")) if match else (key, "")
+    for alias, canonical_unit in _HEADER_UNIT_ALIASES:
+        unit = unit.replace(alias, canonical_unit)
+    for keyword in _HEADER_METRIC_KEYWORDS:
+        if body.endswith(keyword) and len(body) > len(keyword):
+            return body[: -len(keyword)], _HEADER_METRIC_ALIASES.get(keyword, keyword), unit
+    return body, "", unit
+
+
+def _compile_header_matcher() -> Tuple[Dict[str, str], Tuple[str, ...]]:
+    """(기간 헤더 키 → 표준명, 길이 내림차순 지표어) — 지표어는 표준 컬럼의 '산업_지표(단위)' 중 지표 부분과 별칭"""
+    periods = {
+        _header_key(name): canonical
+        for canonical, aliases in _PERIOD_HEADER_ALIASES.items()
+        for name in (canonical,) + aliases
+    }
+    keywords = {_header_key(re.sub(r"\([^()]*\)$", "", col).rsplit("_", 1)[-1]) for col in TREND_COLUMNS if "_" in col}
+    keywords |= set(_HEADER_METRIC_ALIASES) | set(_HEADER_OTHER_METRICS)
+    return periods, tuple(sorted(keywords, key=len, reverse=True))
+
+
+_HEADER_PERIODS, _HEADER_METRIC_KEYWORDS = _compile_header_matcher()
+_HEADER_METRICS = {_header_parts(col): col for col in TREND_COLUMNS}
+_CANONICAL_HEADERS = frozenset(_HEADER_PERIODS.values()) | frozenset(TREND_COLUMNS)
+
+
+def _near_miss(parts: Tuple[str, str, str]) -> Optional[str]:
+    """표준 컬럼과 산업이 같고 지표나 단위 하나만 다른 헤더의 거부 사유 (관계없는 헤더는 None)"""
+    industry, metric, unit = parts
+    if not industry or not metric:
+        return None
+    for (std_industry, std_metric, _), canonical in _HEADER_METRICS.items():
+        if std_industry == industry and std_metric == metric:
+            return f"'{canonical}'과(와) 단위가 달라 매칭하지 않았습니다."
+    for (std_industry, _, std_unit), canonical in _HEADER_METRICS.items():
+        if std_industry == industry and std_unit == unit:
+            return f"'{canonical}'과(와) 지표가 달라 매칭하지 않았습니다."
+    return None
+
+
+def match_headers(columns) -> Tuple[Dict[Any, str], Dict[Any, str]]:
+    """업로드 헤더 → (표준 컬럼명 변환표, 매칭하지 않은 헤더 → 사유) (이미 표준명인 헤더는 제외, 헤더 조합별 캐시)
+
+    기간 헤더는 별칭 완전 일치, 지표 헤더는 (산업, 지표, 단위)가 모두 같을 때만 매칭한다.
+    '반도체_수입(억불)'·'반도체_생산(억원)'처럼 표준 컬럼과 지표나 단위만 다른 헤더는 추측하지 않고 사유와 함께 돌려준다.
+    한 표준명에는 헤더 하나만 대응시킨다.
+    """
+    signature = tuple(columns)
+    cached = _HEADER_CACHE.get(signature)
+    if cached is not None:
+        return cached
+
+    present = set(signature)
+    mapping: Dict[Any, str] = {}
+    rejected: Dict[Any, str] = {}
+    for col in signature:
+        if col in _CANONICAL_HEADERS:
+            continue
+        parts = _header_parts(col)
+        canonical = _HEADER_PERIODS.get(_header_key(col)) or _HEADER_METRICS.get(parts)
+        if canonical is None:
+            reason = _near_miss(parts)
+            if reason:
+                rejected[col] = reason
+        elif canonical in present or canonical in mapping.values():
+            rejected[col] = f"'{canonical}' 컬럼이 이미 있어 매칭하지 않았습니다."
+        else:
+            mapping[col] = canonical
+    result = (mapping, rejected)
+    _HEADER_CACHE.put(signature, result)
+    return result
+
+
+# 이 크기를 넘는 업로드는 청크 단위 스트리밍으로 연도별 집계만 유지한다.
+STREAMING_THRESHOLD_BYTES = 32 * 1024 * 1024
+STREAMING_CHUNK_ROWS = 200_000
+_HASH_BLOCK_BYTES = 1024 * 1024
+
+
+# 키: 업로드 내용 해시 또는 (기본 CSV 경로, mtime, 크기) / 값: (DataFrame 또는 None, 안내 메시지)
+# 캐시된 DataFrame은 모든 세션이 공유하므로 소비 측에서 수정하지 않는다.
+_DATASET_CACHE = LRUCache(DATASET_CACHE_MAX_ENTRIES)
+
+
+def upload_cache_key(uploaded_file) -> Tuple[Tuple[str, str], int]:
+    """업로드 내용을 블록 단위로 해시해 (캐시 키, 바이트 크기) 반환 (전체 복사본을 만들지 않는다)
+
+    전체 내용을 읽으므로, 같은 업로드에 대해 반복 호출하지 말고 결과를 load_dataset(upload_key=...)로 넘긴다.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    size = 0
+    uploaded_file.seek(0)
+    while True:
+        block = uploaded_file.read(_HASH_BLOCK_BYTES)
+        if not block:
+            break
+        hasher.update(block)
+        size += len(block)
+    uploaded_file.seek(0)
+    return ("upload", hasher.hexdigest()), size
+
+
+def _file_cache_key(path: str) -> Optional[Tuple[Any, ...]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return ("file", os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _detect_encoding(prefix) -> Optional[str]:
+    """앞부분 바이트만 보고 인코딩 판별 (BOM → UTF-8 유효성 → CP949 바이트 패턴)"""
+    if bytes(prefix[:3]) == codecs.BOM_UTF8:
+        return "utf-8-sig"
+    # final=False: 잘린 멀티바이트 문자가 접두부 끝에 걸려도 오류로 보지 않는다.
+    for enc in ("utf-8", "cp949"):
+        try:
+            codecs.getincrementaldecoder(enc)().decode(prefix, final=False)
+            return enc
+        except UnicodeDecodeError:
+            continue
+    return None
+
+
+def _read_csv_with_fallback(source, encoding: str) -> pd.DataFrame:
+    """판별된 인코딩으로 한 번만 파싱하고, 접두부 이후에서 디코딩이 깨질 때만 CP949로 재시도"""
+    try:
+        return pd.read_csv(source(), encoding=encoding)
+    except UnicodeDecodeError:
+        if encoding == "cp949":
+            raise
+        return pd.read_csv(source(), encoding="cp949")
+
+
+def _rewound(fileobj):
+    fileobj.seek(0)
+    return fileobj
+
+
+def _aggregate_stream_by_period(chunks) -> Optional[pd.DataFrame]:
+    """청크별 기간(원본 주기) 합계·개수를 누적해 기간별 평균 DataFrame으로 집계 (같은 기간의 행이 여럿이면 평균)
+
+    월/분기 키는 연도로 줄이지 않고 원본 주기 그대로 남겨, 이후 정규화·연 환산(resample_dataset)이 메모리 경로와 같게 한다.
+    """
+    sums: Optional[pd.DataFrame] = None
+    counts: Optional[pd.DataFrame] = None
+    for chunk in chunks:
+        period_key = _period_key(chunk)
+        if period_key is None:
+            raise ValueError(f"기간 컬럼({', '.join(PERIOD_KEY_COLUMNS)}) 중 어느 것도 찾지 못했습니다.")
+        index, _ = period_key
+        if sums is not None and isinstance(index, pd.PeriodIndex) != isinstance(sums.index, pd.PeriodIndex):
+            raise ValueError("청크마다 기간 형식(연/분기/월)이 다릅니다.")
+        valid = np.asarray(index.notna())
+        chunk = chunk.drop(columns=[c for c in PERIOD_KEY_COLUMNS + ["월", "분기"] if c in chunk.columns])
+        grouped = chunk.apply(parse_numeric)[valid].groupby(index[valid])
+        chunk_sums, chunk_counts = grouped.sum(), grouped.count()
+        if sums is None:
+            sums, counts = chunk_sums, chunk_counts
+        else:
+            sums = sums.add(chunk_sums, fill_value=0)
+            counts = counts.add(chunk_counts, fill_value=0)
+    if sums is None:
+        return None
+
+    df = (sums / counts).where(counts > 0)
+    if isinstance(df.index, pd.PeriodIndex):
+        # '2024-01'·'2024Q1' 문자열 키로 넘기면 _normalize_with_reason이 같은 주기의 PeriodIndex로 되돌린다.
+        df.index = pd.Index(df.index.astype(str), name="기간")
+    else:
+        df.index.name = "연도"
+    return df.reset_index()
+
+
+def _parse_upload_streaming(uploaded_file, enc: str) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+    """대용량 업로드 스트리밍 파싱 (_read_csv_with_fallback과 같게, 접두부 이후에서 디코딩이 깨지면 CP949로 재시도)"""
+    try:
+        return _stream_upload(uploaded_file, enc)
+    except UnicodeDecodeError:
+        if enc == "cp949":
+            raise
+        return _stream_upload(uploaded_file, "cp949")
+
+
+def _stream_upload(uploaded_file, enc: str) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+    """대용량 업로드: 기간 키 + 추세 지표 컬럼만 청크 단위로 읽어 기간별로 점진 집계 (품질 리포트는 기간 집계 기준)"""
+    wanted = set(TREND_COLUMNS) | set(PERIOD_KEY_COLUMNS) | {"월", "분기"}
+    header = pd.read_csv(_rewound(uploaded_file), encoding=enc, nrows=0).columns
+    renamed, rejected = match_headers(header)
+    usecols = [col for col in header if renamed.get(col, col) in wanted]
+    chunks = pd.read_csv(
+        _rewound(uploaded_file),
+        encoding=enc,
+        usecols=usecols,
+        chunksize=STREAMING_CHUNK_ROWS,
+    )
+    df = _aggregate_stream_by_period(chunk.rename(columns=renamed) for chunk in chunks)
+    if df is None:
+        return None, "CSV에 데이터 행이 없습니다."
+    df, reason = _normalize_with_reason(df)
+    if df is not None:
+        # 집계 결과는 이미 표준 컬럼명이므로 열 이름 매칭 결과는 원본 헤더 기준으로 다시 적는다.
+        df.attrs["validation_report"]["renamed_columns"] = {str(k): v for k, v in renamed.items()}
+        df.attrs["validation_report"]["rejected_columns"] = {str(k): v for k, v in rejected.items()}
+    return df, reason
+
+
+def _parse_upload(uploaded_file, size: int) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+    """업로드 버퍼에서 디코딩 복사본 없이 직접 파싱해 정규화, (DataFrame, None) 또는 (None, 인식 실패 사유) 반환"""
+    enc = _detect_encoding(_rewound(uploaded_file).read(ENCODING_SNIFF_BYTES))
+    if enc is None:
+        return None, "인코딩을 판별하지 못했습니다 (UTF-8 / CP949 파일만 지원합니다)."
+    try:
+        if size > STREAMING_THRESHOLD_BYTES:
+            return _parse_upload_streaming(uploaded_file, enc)
+        # 업로드 객체(BytesIO)를 그대로 넘겨 bytes/str 사본 없이 파싱한다.
+        df = _read_csv_with_fallback(lambda: _rewound(uploaded_file), enc)
+    except Exception as exc:
+        return None, f"CSV 파싱 중 오류가 발생했습니다 ({type(exc).__name__}: {exc})"
+    return _normalize_with_reason(df)
+
+
+def detect_file_encoding(path: str) -> Optional[str]:
+    """파일 앞부분(ENCODING_SNIFF_BYTES)만 읽어 인코딩 판별 (판별 실패 시 None, 파일을 열 수 없으면 OSError)"""
+    with open(path, "rb") as f:
+        return _detect_encoding(f.read(ENCODING_SNIFF_BYTES))
+
+
+def _read_csv_file(path: str) -> Tuple[Optional[pd.DataFrame], Optional[str], Optional[str]]:
+    """CSV 파일 인코딩 판별 + 파싱 (정규화 전): (원본 DataFrame, 인코딩, None) 또는 (None, None, 실패 사유)"""
+    try:
+        enc = detect_file_encoding(path)
+    except OSError as exc:
+        return None, None, f"파일을 열 수 없습니다 ({exc})"
+    if enc is None:
+        return None, None, "인코딩을 판별하지 못했습니다 (UTF-8 / CP949 파일만 지원합니다)."
+    try:
+        return _read_csv_with_fallback(lambda: path, enc), enc, None
+    except Exception as exc:
+        return None, None, f"CSV 파싱 중 오류가 발생했습니다 ({type(exc).__name__}: {exc})"
+
+
+def _parse_default_file(path: str) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+    """로컬 공식 CSV의 인코딩을 판별한 뒤 파일에서 직접 파싱해 (DataFrame, 인코딩) 반환"""
+    raw, enc, _ = _read_csv_file(path)
+    if raw is None:
+        return None, None
+    return _normalize_df(raw), enc
+
+
+def _sidecar_path(path: str) -> str:
+    return path + SIDECAR_SUFFIX
+
+
+def _load_sidecar(path: str, source_key: Tuple[Any, ...]) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+    """원본 CSV의 mtime/크기가 일치하는 사이드카가 있으면 (DataFrame, 인코딩) 반환"""
+    _, _, mtime_ns, size = source_key
+    try:
+        with np.load(_sidecar_path(path), allow_pickle=False) as npz:
+            if int(npz["version"]) != SIDECAR_FORMAT_VERSION:
+                return None, None
+            if npz["source"].tolist() != [mtime_ns, size]:
+                return None, None
+            columns = npz["columns"].tolist()
+            df = pd.DataFrame(
+                {col: npz[f"column_{i}"] for i, col in enumerate(columns)},
+                index=pd.Index(npz["index"], name="연도"),
+            )
+            bytes_before, bytes_after = npz["memory_report"].tolist()
+            df.attrs["memory_report"] = {"bytes_before": bytes_before, "bytes_after": bytes_after}
+            df.attrs["validation_report"] = json.loads(str(npz["validation_report"]))
+            return df, str(npz["encoding"])
+    except (OSError, KeyError, ValueError):
+        return None, None
+
+
+def _write_sidecar(path: str, source_key: Tuple[Any, ...], df: pd.DataFrame, enc: str) -> None:
+    """정규화된 수치 DataFrame을 사이드카로 원자적으로 저장 (쓰기 실패는 무시)"""
+    if isinstance(df.index, pd.PeriodIndex):
+        return
+    if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes):
+        return
+    _, _, mtime_ns, size = source_key
+    target = _sidecar_path(path)
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target) or ".", suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.savez(
+                f,
+                version=np.int64(SIDECAR_FORMAT_VERSION),
+                source=np.array([mtime_ns, size], dtype=np.int64),
+                encoding=np.array(enc),
+                columns=np.array([str(c) for c in df.columns]),
+                index=df.index.to_numpy(),
+                # 컬럼마다 따로 저장해 float32/float64 혼합 dtype을 그대로 유지한다 (to_numpy는 공통 dtype으로 올림).
+                **{f"column_{i}": df[col].to_numpy() for i, col in enumerate(df.columns)},
+                memory_report=np.array(
+                    [df.attrs["memory_report"]["bytes_before"], df.attrs["memory_report"]["bytes_after"]],
+                    dtype=np.int64,
+                ),
+                validation_report=np.array(json.dumps(df.attrs["validation_report"], ensure_ascii=False)),
+            )
+        os.replace(tmp_path, target)
+    except OSError:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _load_default_dataset(path: str, source_key: Tuple[Any, ...]) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+    """사이드카를 우선 읽고, 없거나 오래되었으면 CSV를 파싱해 사이드카를 갱신"""
+    df, enc = _load_sidecar(path, source_key)
+    if df is not None:
+        return df, enc
+    df, enc = _parse_default_file(path)
+    if df is not None:
+        _write_sidecar(path, source_key, df, enc)
+    return df, enc
+
+
+def replace_cached_dataset(key: Any, df: pd.DataFrame) -> None:
+    """데이터 캐시에 key로 들어 있는 데이터셋을 df로 교체 (캐시에 없으면 아무것도 하지 않음)
+
+    같은 원본(업로드/기본 CSV)을 여는 다른 세션이 다시 파싱하지 않고 갱신된 데이터셋을 받게 할 때 쓴다.
+    """
+    cached = _DATASET_CACHE.get(key, _MISSING)
+    if isinstance(cached, tuple):
+        _DATASET_CACHE.put(key, (df,) + cached[1:])
+    elif cached is not _MISSING:
+        _DATASET_CACHE.put(key, df)
+
+
+def load_csv(path: str) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+    """지정한 CSV 하나를 정규화해 (DataFrame, None) 또는 (None, 인식 실패 사유) 반환 (캐시·사이드카 없음)"""
+    raw, _, reason = _read_csv_file(path)
+    if raw is None:
+        return None, reason
+    return _normalize_with_reason(raw)
+
+
+def load_dataset(
+    uploaded_file=None, upload_key: Optional[Tuple[Tuple[str, str], int]] = None
+) -> Tuple[pd.DataFrame, List[Tuple[str, str]]]:
+    """사용자 CSV 또는 로컬 공식 CSV / 더미 데이터 로드 (방어적으로 처리, 데이터셋 단위 캐시)
+
+    화면에 띄울 안내는 직접 출력하지 않고 (수준, 메시지) 목록으로 함께 반환한다. 수준은 "info" 또는 "warning".
+    upload_key에 이미 구한 upload_cache_key(uploaded_file) 결과를 주면 업로드 내용을 다시 해시하지 않는다.
+    """
+    notices: List[Tuple[str, str]] = []
+    # 1) 업로드된 CSV가 있다면 우선 사용
+    if uploaded_file is not None:
+        try:
+            key, size = upload_key if upload_key is not None else upload_cache_key(uploaded_file)
+        except Exception:
+            notices.append(("warning", "CSV 파일을 읽는 중 오류가 발생했습니다. 기본 데이터를 사용합니다."))
+            size = 0
+
+        if size:
+            cached = _DATASET_CACHE.get(key, _MISSING)
+            if cached is _MISSING:
+                # 인식 실패 결과(None, 사유)도 캐시해 같은 파일을 매 rerun마다 다시 파싱하지 않는다.
+                cached = _parse_upload(uploaded_file, size)
+                if cached[0] is not None:
+                    register_dataset(cached[0], key)
+                _DATASET_CACHE.put(key, cached)
+            df_upload, reason = cached
+            if df_upload is not None:
+                return df_upload, notices
+            notices.append(("warning", f"업로드한 CSV를 인식하지 못했습니다: {reason} 기본 데이터를 사용합니다."))
+
+    # 2) 업로드가 없거나 실패하면, 로컬 공식 CSV 시도
+    default_path = DEFAULT_DATA_PATH
+    key = _file_cache_key(default_path)
+    if key is not None:
+        cached = _DATASET_CACHE.get(key, _MISSING)
+        if cached is _MISSING:
+            cached = _load_default_dataset(default_path, key)
+            if cached[0] is not None:
+                register_dataset(cached[0], key)
+            _DATASET_CACHE.put(key, cached)
+        df_norm, enc = cached
+        if df_norm is not None:
+            notices.append(("info", f"로컬 CSV 파일('{default_path}')을(를) 인코딩 {enc}로 불러왔습니다."))
+            return df_norm, notices
+
+    # 3) 모든 시도가 실패하면 더미 데이터 사용
+    notices.append(("warning", "공식 CSV를 찾지 못하거나 구조를 인식하지 못해, 시뮬레이션용 더미 데이터를 사용합니다."))
+    cached = _DATASET_CACHE.get(("dummy",), _MISSING)
+    if cached is _MISSING:
+        cached = create_dummy_data()
+        register_dataset(cached, ("dummy",))
+        _DATASET_CACHE.put(("dummy",), cached)
+    return cached, notices
+
+
+def load_source(path: Optional[str] = None) -> Tuple[pd.DataFrame, List[Tuple[str, str]]]:
+    """명령줄용 로드: path를 주면 그 CSV만 읽고(인식 실패 시 ValueError), 없으면 load_dataset과 같은 순서로 로드"""
+    if path is None:
+        return load_dataset()
+    df, reason = load_csv(path)
+    if df is None:
+        raise ValueError(f"데이터 CSV를 인식하지 못했습니다: {reason}")
+    return df, []
@@ -0,0 +1,204 @@
+"""예상 면접 질문 은행: 태그(산업·세부 분야·직무) 비트셋 색인, 설문별 질문 선택, 프로필 유사도 순위"""
+
+import hashlib
+import json
+import random
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .cache import LRUCache
+from .text import char_bigrams
+
+QUESTION_BANK_PATH = Path(__file__).with_name("interview_questions.json")
+WILDCARD = "*"
+# 설문 한 건에 보여 줄 최대 질문 수 (해당 질문이 더 많으면 설문 지문으로 고정 추출)
+INTERVIEW_QUESTION_COUNT = 5
+# 설문 질문과 별도로 프로필 유사도로 더 보여 줄 관련 질문 수
+RELATED_QUESTION_COUNT = 3
+
+# 질문 세부 분야 태그 → 설문 세부 분야 응답에 들어 있으면 해당하는 키워드
+SUB_INDUSTRY_TAG_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "메모리": ("메모리", "DRAM", "NAND"),
+    "시스템 반도체": ("시스템 반도체", "파운드리"),
+}
+
+# 설문 응답으로 질문을 고르는 태그 (난이도·주제 태그는 색인하지 않고, 주제는 TF-IDF 색인어로만 쓴다)
+_TAG_FACETS = ("industry", "sub_industry", "role")
+
+
+class QuestionBank:
+    """질문 목록 + 태그값별 비트셋(파이썬 int, 비트 i = 질문 i) 색인
+
+    산업·세부 분야·직무 태그 '*'는 모든 값에 해당하는 질문이다. 설문에 해당하는 질문 선택은
+    (값 비트셋 | 와일드카드 비트셋)을 축마다 구해 AND 하는 것뿐이라, 질문 수가 늘어도 파이썬 연산 횟수는 그대로다.
+    질문 문장은 TF-IDF 희소 행렬(CSR)로도 색인해, 사용자 프로필과의 유사도 순위(personalize)에 쓴다.
+    """
+
+    def __init__(self, records: Iterable[Dict[str, Any]]):
+        self.records: List[Dict[str, Any]] = list(records)
+        self.questions: List[str] = [record["question"] for record in self.records]
+        self.index: Dict[str, Dict[str, int]] = {facet: {} for facet in _TAG_FACETS}
+        for question_id, record in enumerate(self.records):
+            bit = 1 << question_id
+            for facet in _TAG_FACETS:
+                values = record.get(facet, WILDCARD)
+                for value in (values,) if isinstance(values, str) else values:
+                    self.index[facet][value] = self.index[facet].get(value, 0) | bit
+        self._selection_cache = LRUCache(1024)
+        # 산업별(와일드카드 포함) 질문 번호 배열: 관련 질문 후보를 호출마다 비트셋에서 풀지 않도록 미리 만든다.
+        wildcard_ids = np.array(_bit_positions(self.index["industry"].get(WILDCARD, 0)), dtype=np.int64)
+        self._industry_ids: Dict[Optional[str], np.ndarray] = {None: wildcard_ids}
+        for value in self.index["industry"]:
+            if value != WILDCARD:
+                self._industry_ids[value] = np.array(_bit_positions(self.mask("industry", [value])), dtype=np.int64)
+        self._build_tfidf()
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def _build_tfidf(self) -> None:
+        """질문별 TF-IDF 행렬을 CSR 배열(indptr/indices/data)로 만든다
+
+        색인어는 질문 문장·주제 태그·와일드카드가 아닌 세부 분야/직무 태그의 글자 2-gram,
+        가중치는 (1 + log tf) × 평활 idf이며 행마다 L2 정규화해 내적이 곧 코사인 유사도가 된다.
+        """
+        self.vocabulary: Dict[str, int] = {}
+        counts: List[Counter] = []
+        for record in self.records:
+            tags = [record.get(facet, WILDCARD) for facet in ("sub_industry", "role")]
+            text = " ".join([record["question"], *record.get("topics", []), *(tag for tag in tags if tag != WILDCARD)])
+            tf = Counter(char_bigrams(text))
+            for term in tf:
+                self.vocabulary.setdefault(term, len(self.vocabulary))
+            counts.append(tf)
+
+        indptr = np.zeros(len(counts) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(tf) for tf in counts])
+        indices = np.fromiter((self.vocabulary[term] for tf in counts for term in tf), dtype=np.int32, count=indptr[-1])
+        tf_values = np.fromiter((count for tf in counts for count in tf.values()), dtype=np.float64, count=indptr[-1])
+        doc_freq = np.bincount(indices, minlength=len(self.vocabulary))
+        self.idf = np.log((1 + len(counts)) / (1 + doc_freq)) + 1.0
+        data = (1 + np.log(tf_values)) * self.idf[indices]
+        row_norms = np.sqrt(_row_sums(data**2, indptr))
+        data /= np.repeat(np.where(row_norms > 0, row_norms, 1.0), np.diff(indptr))
+        self.indptr, self.indices, self.data = indptr, indices, data
+
+    def similarity(self, query: str) -> np.ndarray:
+        """질의 텍스트와 모든 질문의 코사인 유사도 (CSR 행렬 × 질의 벡터 한 번)"""
+        scores = np.zeros(len(self))
+        tf = Counter(term for term in char_bigrams(query) if term in self.vocabulary)
+        if not tf or not len(self.data):
+            return scores
+        query_vector = np.zeros(len(self.vocabulary))
+        columns = np.fromiter((self.vocabulary[term] for term in tf), dtype=np.int64, count=len(tf))
+        query_vector[columns] = (1 + np.log(np.fromiter(tf.values(), dtype=np.float64, count=len(tf)))) * self.idf[columns]
+        query_vector /= np.linalg.norm(query_vector)
+        return _row_sums(self.data * query_vector[self.indices], self.indptr)
+
+    def top_similar(self, scores: np.ndarray, candidates: Sequence[int], k: int) -> List[int]:
+        """후보 질문 중 유사도 상위 k개 번호 (유사도 내림차순, 동점이면 질문 은행 순서, 유사도 0 제외)"""
+        candidates = np.asarray(candidates, dtype=np.int64)
+        candidates = candidates[scores[candidates] > 0]
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        return candidates[np.lexsort((candidates, -scores[candidates]))].tolist()
+
+    def mask(self, facet: str, values: Sequence[str]) -> int:
+        """태그값들(OR) + 와일드카드 질문 비트셋"""
+        by_value = self.index[facet]
+        result = by_value.get(WILDCARD, 0)
+        for value in values:
+            result |= by_value.get(value, 0)
+        return result
+
+    def select_mask(self, industry: Optional[str], sub_industry: Optional[str], job_role: Optional[str]) -> int:
+        """설문 (산업, 세부 분야, 직무) → 해당 질문 비트셋"""
+        sub_tags = [
+            tag for tag, keywords in SUB_INDUSTRY_TAG_KEYWORDS.items() if any(kw in (sub_industry or "") for kw in keywords)
+        ]
+        return (
+            self.mask("industry", [industry] if industry else [])
+            & self.mask("sub_industry", sub_tags)
+            & self.mask("role", [job_role] if job_role else [])
+        )
+
+    def sample_ids(
+        self,
+        industry: Optional[str],
+        sub_industry: Optional[str],
+        job_role: Optional[str],
+        n: int = INTERVIEW_QUESTION_COUNT,
+    ) -> Tuple[int, ...]:
+        """설문에 해당하는 질문 중 n개의 번호 (같은 설문이면 항상 같은 질문, 질문 은행 순서)
+
+        해당 질문이 n개 이하면 전부 돌려준다. 더 많으면 (산업, 세부 분야, 직무) 지문으로 시드를 정해
+        추출하므로, 추천 테이블 사전 계산·배치·대시보드가 같은 질문을 보여 준다.
+        """
+        key = (industry, sub_industry, job_role, n)
+        cached = self._selection_cache.get(key)
+        if cached is not None:
+            return cached
+        question_ids = _bit_positions(self.select_mask(industry, sub_industry, job_role))
+        if len(question_ids) > n:
+            digest = hashlib.sha256(repr(key[:3]).encode("utf-8")).digest()
+            question_ids = sorted(random.Random(int.from_bytes(digest[:8], "big")).sample(question_ids, n))
+        selected = tuple(question_ids)
+        self._selection_cache.put(key, selected)
+        return selected
+
+    def personalize(
+        self,
+        industry: Optional[str],
+        sub_industry: Optional[str],
+        job_role: Optional[str],
+        profile: str,
+        n: int = INTERVIEW_QUESTION_COUNT,
+        related: int = RELATED_QUESTION_COUNT,
+    ) -> Dict[str, List[str]]:
+        """설문 질문(sample_ids)을 프로필 유사도 순으로 정렬하고, 같은 산업 질문 중 유사도 상위 관련 질문을 더한다
+
+        반환: {"interview_questions": [...], "related_questions": [...]}
+        """
+        scores = self.similarity(profile)
+        selected = self.sample_ids(industry, sub_industry, job_role, n)
+        ordered = sorted(selected, key=lambda question_id: (-scores[question_id], question_id))
+        candidates = self._industry_ids.get(industry or None, self._industry_ids[None])
+        others = candidates[~np.isin(candidates, np.asarray(selected, dtype=np.int64))]
+        return {
+            "interview_questions": [self.questions[question_id] for question_id in ordered],
+            "related_questions": [self.questions[question_id] for question_id in self.top_similar(scores, others, related)],
+        }
+
+
+def _row_sums(values: np.ndarray, indptr: np.ndarray) -> np.ndarray:
+    """CSR 값 배열의 행별 합 (빈 행은 0)
+
+    np.add.reduceat은 끝 위치(len)를 시작 위치로 받지 못하고 빈 행에서는 다음 값을 돌려주므로,
+    값 끝에 0을 하나 붙여 모든 시작 위치를 유효하게 만든 뒤 빈 행을 0으로 덮는다.
+    (시작 위치를 len-1로 자르면 끝의 빈 행 바로 앞 행이 마지막 값을 잃는다.)
+    """
+    sums = np.add.reduceat(np.append(values, 0.0), indptr[:-1])
+    sums[indptr[:-1] == indptr[1:]] = 0.0
+    return sums
+
+
+def _bit_positions(mask: int) -> List[int]:
+    """비트셋 → 켜진 비트 위치 (오름차순)"""
+    positions = []
+    while mask:
+        low = mask & -mask
+        positions.append(low.bit_length() - 1)
+        mask ^= low
+    return positions
+
+
+def load_question_bank(path: Path = QUESTION_BANK_PATH) -> QuestionBank:
+    """JSON 질문 목록 파일 → QuestionBank (항목: question, industry, sub_industry, role, difficulty, topics)"""
+    with open(path, encoding="utf-8") as f:
+        return QuestionBank(json.load(f))
+
+
+QUESTION_BANK = load_question_bank()
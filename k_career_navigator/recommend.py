@@ -0,0 +1,537 @@
+"""설문 응답 기반 맞춤 추천: 선택지, 규칙, 결정 테이블, 전체 조합 사전 계산"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .cache import LRUCache, dataset_key
+from .questions import QUESTION_BANK
+from .trends import analyze_trends, describe_market, forecast_industry
+
+
+# 설문 선택지: 단계별 화면과 추천 결정 테이블이 같은 목록을 공유한다 (목록 순서 = 선택지 ID).
+INDUSTRY_OPTIONS = ["반도체", "디스플레이"]
+SUB_INDUSTRY_OPTIONS: Dict[str, List[str]] = {
+    "반도체": [
+        "메모리(HBM,DRAM)",
+        "시스템 반도체(파운드리,팹리스)",
+        "소자/재료/장비",
+    ],
+    "디스플레이": [
+        "대형 패널(TV)",
+        "중소형 패널(모바일,IT,XR)",
+        "소자/재료/장비",
+    ],
+}
+STATUS_OPTIONS = [
+    "이제 정보를 모으기 시작하는 단계이다. (입문 단계)",
+    "전공 공부는 하고 있지만 직무 준비는 아직 부족하다.",
+    "프로젝트·대외활동 등 기본 경험은 있다.",
+    "포트폴리오·자기소개서 등 취업 준비를 본격적으로 하고 있다.",
+    "인턴/계약직/실무 경험이 있어 실전 준비가 되어 있다.",
+]
+MAJOR_OPTIONS = [
+    "전자공학",
+    "재료/화학공학",
+    "컴퓨터공학/SW",
+    "기계공학",
+    "산업공학",
+    "상경/인문계열",
+]
+JOB_ROLE_OPTIONS = [
+    "R&D(회로/설계)",
+    "R&D(소자/재료)",
+    "공정/제조/설비",
+    "품질/수율(QA)",
+    "경영/기획/전략",
+    "영업/마케팅/CS",
+]
+STRENGTH_OPTIONS = [
+    "분석적 사고력 (R&D/공정)",
+    "문제 해결 능력 (장비/엔지니어)",
+    "수치감각/정확성 (품질·수율)",
+    "커뮤니케이션 (마케팅/전략/CS)",
+]
+BIZ_TALK_OPTIONS = ["가능", "불가능"]
+THEORY_LEVEL_OPTIONS = ["하", "중", "상"]
+
+STATUS_TIPS: Dict[str, str] = {
+    # ① 1-2학년 (전공 기초 단계)
+    "입문 단계": (
+        "① 1-2학년 (전공 기초 단계)  \n"
+        "- 핵심 조언: \"학점이 곧 깡패\"입니다. 특히 반도체·디스플레이 직무는 전공 평점이 필터 역할을 합니다.  \n"
+        "- 목표: 최소 3.8 / 4.5 이상을 노려 보세요. 전공 기초 과목에서 B0 이하가 없도록 관리하는 것이 좋습니다.  \n"
+        "- 필수 과목 예시: 전자계열은 회로이론·전자기학·고체물리, 화공계열은 유기화학, 기계계열은 열역학 등 각 계열의 핵심 기초 과목입니다.  \n"
+        "- 추천 활동: 아두이노·라즈베리파이 기반의 작은 HW-SW 프로젝트를 하나라도 '완성'해 보세요. 결과물의 규모보다 끝까지 마무리해 본 경험이 중요합니다."
+    ),
+    # ② 3-4학년 (직무 탐색 단계)
+    "기본 경험 보유": (
+        "② 3-4학년 (직무 탐색 단계)  \n"
+        "- 핵심 조언: 이제는 \"어떤 공정/직무를 담당하고 싶은지\"를 구체화해야 하는 시기입니다.  \n"
+        "- 필수 활동: 최소 6개월 이상 학부연구생 경험 또는 나노종합기술원·KANC·IDEC 등에서의 반도체 공정 실습을 권장합니다.  \n"
+        "- 자격증 전략: 직무와 직접 관련 없는 기사 자격증보다, 데이터 기반 의사결정을 보여주는 ADsP(데이터분석준전문가), 6 Sigma GB 같은 자격이 실무에서 더 우대되는 편입니다.  \n"
+        "- 정리 포인트: 지금까지의 프로젝트/대외활동을 지원하려는 공정·직무와 연결해 \"내가 왜 이 포지션과 잘 맞는지\"를 문장으로 정리해 두세요."
+    ),
+    # ③ 실무 경험 보유 / 중고신입
+    "실무 경험 보유": (
+        "③ 실무 경험 보유 / 중고신입  \n"
+        "- 핵심 조언: 단순히 '많이 해봤다'가 아니라, 기존 경험을 새 산업/새 직무 관점에서 재해석하는 것이 중요합니다.  \n"
+        "- 자소서 구조: `어떤 문제(Issue)를` → `어떤 데이터로 분석해` → `어떻게 해결(Action)했는지` → `결과(수치)` 순으로 정리하세요.  \n"
+        "- 이직/지원 사유: 현재 산업의 호황/불황 국면과, 지원 기업의 CAPEX(투자 계획)를 연결해 \"왜 지금 이 회사/직무인지\" 논리를 만드는 것이 좋습니다."
+    ),
+    # ④ 일반 취준생 (경험 부족)
+    "전공은 하나 직무 경험 부족": (
+        "④ 일반 취준생 (경험 부족)  \n"
+        "- 핵심 조언: 전공 지식은 있지만, 현장 용어·프로세스에 대한 이해가 부족한 상태일 가능성이 큽니다.  \n"
+        "- 실행 방안: NCS 기반 직무 교육 과정이나 기업 연계 부트캠프를 통해, OCAP(Out of Control Action Plan, 이상 발생 시 조치 계획)과 같은 현장 용어를 빠르게 익히는 것을 추천합니다.  \n"
+        "- 동시에, 교육 과정에서 사용하는 실제 공정/품질 리포트 포맷에 익숙해지면, 이후 인턴·신입 면접에서 큰 도움을 받을 수 있습니다."
+    ),
+    # 기타 상태(포트폴리오 작성 단계 등)는 기존 로직 활용
+    "본격 취업 준비 중": (
+        "포트폴리오·자기소개서를 본격적으로 준비하는 단계라면, 지금까지의 활동을 산업 사이클과 연결해 재구성해야 합니다. "
+        "최근 3~5년간의 생산·수출·가격 데이터를 간단히 분석해, \"성장하는 영역\"과 \"구조적 어려움이 있는 영역\"을 구분하고, "
+        "내 경험이 어떤 부분을 보완할 수 있는지에 초점을 맞춰 스토리를 설계해 보세요."
+    ),
+}
+
+JOB_STRENGTH_TIPS: Dict[str, Dict[str, str]] = {
+    "R&D(회로/설계)": {
+        "분석적 사고": (
+            "[R&D] + 데이터 분석 관점입니다.  \n"
+            "- TCAD·회로 시뮬레이션 결과와 실제 계측 데이터의 **정합성(Fitting)**을 맞춰 본 경험을 강조하세요.  \n"
+            "- 단순히 \"시뮬레이션을 돌려봤다\"가 아니라, 어떤 파라미터를 조정하며 오차를 줄였는지, 그 과정에서 사용한 툴과 수식을 함께 설명하면 좋습니다."
+        ),
+        "문제 해결": (
+            "디지털·아날로그 회로 설계 프로젝트에서 발생한 버그를 어떻게 추적했는지, 구체적인 시나리오로 정리해 두세요.  \n"
+            "예를 들어, 타이밍 미스나 기능 오류가 발생했을 때, 파형 분석 → RTL/테스트벤치 수정 → 재검증까지의 단계별 접근을 설명하는 것이 좋습니다."
+        ),
+        "수치/정확성": (
+            "설계 결과를 PPA(Power, Performance, Area) 관점에서 정량적으로 비교한 경험을 어필하세요.  \n"
+            "Baseline 설계와 최적화 설계의 타이밍 여유, 소비 전력, 셀 면적 등을 표로 비교하고, 어떤 트레이드오프를 선택했는지 설명할 수 있으면 좋습니다."
+        ),
+        "커뮤니케이션": (
+            "[R&D] + 소통/협업 관점입니다.  \n"
+            "연구는 혼자 하는 것이 아닙니다. 설계·검증·공정 팀 또는 석·박사 연구원과 기술 난제를 함께 해결해 본 경험이 있다면, "
+            "당시 사용했던 용어·자료(블록 다이어그램, 타이밍 다이어그램 등)를 어떻게 조율했는지 중심으로 정리해 두세요."
+        ),
+    },
+    "공정/제조/설비": {
+        "분석적 사고": (
+            "[공정/품질] + 데이터 분석 관점입니다.  \n"
+            "수율(Yield) 개선을 위해 공정 변수(Parameter)와 불량률 간의 상관관계를 분석해 본 경험을 강조하세요. "
+            "엑셀·Python·JMP·Spotfire 등을 활용해 트렌드·산점도·상관계수 등을 시각화한 사례를 준비하면 좋습니다."
+        ),
+        "문제 해결": (
+            "[공정/품질] + 문제 해결, 그리고 [설비] + 문제 해결 관점을 함께 담습니다.  \n"
+            "감이나 경험치가 아니라, Fishbone, 5 Whys 같은 RCA(Root Cause Analysis) 툴을 사용해 문제 원인을 추적하고 재발을 막은 사례를 준비하세요.  \n"
+            "특히 장비 다운타임을 줄이기 위해 예지보전(PdM) 개념이나 기구학·유체역학 지식을 활용한 경험이 있다면 강하게 어필할 수 있습니다."
+        ),
+        "수치/정확성": (
+            "Fab에서는 파라미터 1~2% 오차가 큰 손실로 이어질 수 있습니다.  \n"
+            "공정 조건·레시피·체크리스트를 얼마나 꼼꼼하게 관리했는지, FMEA나 점검표를 통해 불량률을 얼마나 줄였는지 수치 중심으로 설명하세요."
+        ),
+        "커뮤니케이션": (
+            "공정 변경·라인 이슈를 생산·품질·설비·외주사와 함께 조율한 경험이 있다면, 그 과정을 단계별로 정리해 두세요.  \n"
+            "특히 OCAP(Out of Control Action Plan)와 같은 프로세스에 참여한 경험이 있다면, 어떤 역할을 했는지 구체적으로 설명하면 좋습니다."
+        ),
+    },
+    "품질/수율(QA)": {
+        "분석적 사고": (
+            "[공정/품질] + 문제 해결 관점과 연결됩니다.  \n"
+            "Fishbone, 5 Whys, Pareto 차트와 같은 도구를 사용해 불량 원인을 구조적으로 분석하고 재발을 막은 경험을 준비하세요."
+        ),
+        "수치/정확성": (
+            "Cpk/PPK, 불량률, 신뢰성 시험 결과 등 품질 지표를 숫자로 관리해 본 경험을 강조하세요.  \n"
+            "미세한 이상 징후를 조기에 포착해 큰 이슈를 막은 사례가 있다면 매우 설득력 있는 스토리가 됩니다."
+        ),
+        "문제 해결": (
+            "고객사 클레임이나 내부 품질 이슈를 단순 봉합이 아닌 '재발 방지' 수준까지 끌어올린 경험이 중요합니다.  \n"
+            "표준 개정, 교육, 설비 변경 등 구체적인 액션과 그 후의 지표 변화를 함께 설명해 보세요."
+        ),
+        "커뮤니케이션": (
+            "품질 직무는 숫자와 스토리를 동시에 다룹니다.  \n"
+            "8D Report, A3 Report 같은 형식을 참고해 본인의 프로젝트를 정리하고, 고객사·내부 조직에 어떻게 설명했는지 구조화해서 말할 수 있도록 준비하세요."
+        ),
+    },
+    "경영/기획/전략": {
+        "분석적 사고": (
+            "산업 리포트와 기업 IR 자료를 기반으로 CAPEX·R&D 비율, ASP, 수출 지표를 분석해 본 경험을 강조하세요.  \n"
+            "단순 요약이 아니라, \"그래서 어떤 전략이 필요한가?\"까지 자신의 의견을 붙이는 것이 중요합니다."
+        ),
+        "커뮤니케이션": (
+            "전략/기획 직무는 숫자를 스토리로 바꾸는 역할입니다.  \n"
+            "산업/경쟁사 분석 결과를 A4 리포트와 5장 내외의 PPT로 요약해 발표해 본 경험이 있다면, 그 구조와 피드백을 중심으로 어필하세요."
+        ),
+    },
+    "영업/마케팅/CS": {
+        "커뮤니케이션": (
+            "[영업/마케팅] + 소통 관점입니다.  \n"
+            "고객사(예: 모바일·서버·자동차 OEM)의 기술 로드맵을 이해하고, 자사 기술 용어를 고객의 비즈니스 언어로 번역해 전달한 경험을 강조하세요.  \n"
+            "프레젠테이션, 제안서, 미팅에서 어떤 식으로 표현을 바꿨는지 구체적인 문장 예시를 준비하면 좋습니다."
+        ),
+        "문제 해결": (
+            "CS/Field 엔지니어 관점에서, 고객사 현장에서 발생한 장애를 어떻게 진단하고 조치했는지 구체적인 사례를 준비하세요.  \n"
+            "다운타임(Down-time) 감소 시간, 재방문률 감소 등 수치로 표현할 수 있다면 설득력이 크게 올라갑니다."
+        ),
+    },
+}
+
+
+def build_keywords(industry: str, sub_industry: str, job_role: str, strength_label: str) -> Dict[str, Any]:
+    """키워드 클라우드용 추천 해시태그 생성 (semi.prd.md 로직 간략화 버전)"""
+    keywords = set()
+    keywords.add(industry)
+    keywords.add(sub_industry.split("(")[0])
+    keywords.add(job_role.split("(")[0])
+
+    # 강점 관련
+    if strength_label == "분석적 사고":
+        keywords.update(["데이터 분석", "가설 검증", "근본 원인", "논리적 사고"])
+    if strength_label == "문제 해결":
+        keywords.update(["Trouble Shooting", "디버깅", "원인 분석", "재발 방지"])
+    if strength_label == "수치/정확성":
+        keywords.update(["수율(Yield)", "정량 분석", "신뢰성", "SPC"])
+    if strength_label == "커뮤니케이션":
+        keywords.update(["협업", "보고서", "설득력", "VOC", "B2B"])
+
+    # 직무별
+    if job_role == "R&D(회로/설계)":
+        keywords.update(["EDA", "Verilog", "VLSI", "컴퓨터 구조", "PDK", "Setup/Hold"])
+    if job_role == "R&D(소자/재료)":
+        keywords.update(["TCAD", "고체물리", "신소자", "EUV", "GAA", "TSV"])
+    if job_role == "공정/제조/설비":
+        keywords.update(["8대 공정", "SPC", "FMEA", "JMP", "CapEx"])
+    if job_role == "품질/수율(QA)":
+        keywords.update(["불량 분석", "신뢰성", "JMP", "ISO", "VOC"])
+    if job_role == "경영/기획/전략":
+        keywords.update(["SCM", "시장 분석", "재무제표", "사이클 산업", "경쟁사 분석"])
+    if job_role == "영업/마케팅/CS":
+        keywords.update(["B2B", "기술 영업", "고객사 대응", "로드맵", "Needs 분석"])
+
+    # 산업/트렌드
+    if industry == "반도체":
+        keywords.update(["HBM", "AI 반도체", "파운드리", "TSMC", "Nvidia", "CXL"])
+    if industry == "디스플레이":
+        keywords.update(["OLED", "XR", "전장 디스플레이", "LTPO"])
+
+    return {"keywords": sorted(list(keywords))}
+
+
+def _status_tip(status: Optional[str]) -> str:
+    """Q3 준비 상태 → 시기별 조언"""
+    status_key = status or ""
+    if "입문" in status_key:
+        return STATUS_TIPS["입문 단계"]
+    elif "전공 공부" in status_key:
+        return STATUS_TIPS["전공은 하나 직무 경험 부족"]
+    elif "기본 경험" in status_key:
+        return STATUS_TIPS["기본 경험 보유"]
+    elif "포트폴리오" in status_key:
+        return STATUS_TIPS["본격 취업 준비 중"]
+    elif "인턴/계약직" in status_key or "실무 경험" in status_key:
+        return STATUS_TIPS["실무 경험 보유"]
+    return "현재 상황에 맞는 구체적인 목표와 타임라인을 먼저 정의해 보세요."
+
+
+def _strength_label(strength: Optional[str]) -> Optional[str]:
+    """Q6 강점 선택지 → 직무별 조언 사전의 강점 키"""
+    if strength:
+        if "분석적 사고력" in strength:
+            return "분석적 사고"
+        elif "문제 해결 능력" in strength:
+            return "문제 해결"
+        elif "수치감각/정확성" in strength:
+            return "수치/정확성"
+        elif "커뮤니케이션" in strength:
+            return "커뮤니케이션"
+    return None
+
+
+def _complement_tips(
+    job_role: Optional[str], major: Optional[str], biz_talk: Optional[str], theory_level: Optional[str]
+) -> List[str]:
+    """전공/전문성 보완 조언 (Q4, Q5, Q7 조건 기반)"""
+    complement_tips = []
+    # Q5 = R&D 이면서 Q7 = "하"
+    if job_role and job_role.startswith("R&D") and theory_level == "하":
+        complement_tips.append(
+            "석사 수준 전공지식이 요구됩니다. 핵심 과목(소자, 공정, VLSI)을 전공서 기준으로 다시 정리하는 것이 필수입니다."
+        )
+    # Q4 = 상경/인문계열 이면서 Q5 = 기술 직무(공정/품질/소자)
+    if major == "상경/인문계열" and job_role in ["공정/제조/설비", "품질/수율(QA)", "R&D(소자/재료)"]:
+        complement_tips.append(
+            "8대 공정, 반도체/디스플레이 기본 구조 등 기술 기초 교육(K-MOOC 등)을 반드시 이수하는 것을 추천합니다."
+        )
+    # Q5 = 영업/마케팅/CS 또는 경영/기획/전략 이면서 Biz Talk = 불가능
+    if job_role in ["영업/마케팅/CS", "경영/기획/전략"] and biz_talk == "불가능":
+        complement_tips.append(
+            "B2B 회화 능력이 중요합니다. OPIc IH 또는 토익스피킹 고득점을 목표로 별도의 말하기 학습 플랜을 세워야 합니다."
+        )
+    return complement_tips
+
+
+def _interview_questions(
+    industry: Optional[str],
+    sub_industry: Optional[str],
+    job_role: Optional[str],
+    strength_label: Optional[str],
+    keywords: List[str],
+) -> Dict[str, List[str]]:
+    """예상 면접 질문 (질문 은행에서 산업·세부 분야·직무 태그로 선택) + 관련 질문
+
+    직무·강점·세부 분야·키워드 클라우드로 만든 프로필과의 TF-IDF 유사도가 높은 질문부터 보여 준다.
+    """
+    profile = " ".join([job_role or "", strength_label or "", sub_industry or "", *keywords])
+    return QUESTION_BANK.personalize(industry, sub_industry, job_role, profile)
+
+
+def _profile_from_rules(
+    industry, sub_industry, status, major, job_role, strength, biz_talk, theory_level
+) -> Dict[str, Any]:
+    """규칙 함수를 직접 평가한 추천 결과의 설문 의존 부분 (산업 데이터와 무관)"""
+    strength_label = _strength_label(strength)
+    core_advice = JOB_STRENGTH_TIPS.get(job_role or "", {}).get(strength_label, "") if strength_label else ""
+    keywords = build_keywords(
+        industry=industry or "",
+        sub_industry=sub_industry or "",
+        job_role=job_role or "",
+        strength_label=strength_label or "",
+    )["keywords"]
+    profile: Dict[str, Any] = {
+        "status_tip": _status_tip(status),
+        "core_advice": core_advice,
+        "complement_tips": _complement_tips(job_role, major, biz_talk, theory_level),
+    }
+    profile.update(_interview_questions(industry, sub_industry, job_role, strength_label, keywords))
+    profile["keywords"] = keywords
+    return profile
+
+
+# 추천 결과에 들어가는 설문 항목 (지문 순서)
+SURVEY_FIELDS = ("industry", "sub_industry", "status", "major", "job_role", "strength", "biz_talk", "theory_level")
+_FIELD_OPTIONS = {
+    "industry": INDUSTRY_OPTIONS,
+    "status": STATUS_OPTIONS,
+    "major": MAJOR_OPTIONS,
+    "job_role": JOB_ROLE_OPTIONS,
+    "strength": STRENGTH_OPTIONS,
+    "biz_talk": BIZ_TALK_OPTIONS,
+    "theory_level": THEORY_LEVEL_OPTIONS,
+}
+_OPTION_IDS = {field: {option: i for i, option in enumerate(options)} for field, options in _FIELD_OPTIONS.items()}
+_SUB_INDUSTRY_IDS = {
+    industry: {option: i for i, option in enumerate(options)} for industry, options in SUB_INDUSTRY_OPTIONS.items()
+}
+
+
+def survey_option_ids(survey: Dict[str, Any]) -> Optional[Tuple[int, ...]]:
+    """설문 응답 → SURVEY_FIELDS 순서의 선택지 ID 튜플 (선택지 목록에 없는 값이 하나라도 있으면 None)"""
+    ids = []
+    for field in SURVEY_FIELDS:
+        if field == "sub_industry":
+            table = _SUB_INDUSTRY_IDS.get(survey.get("industry"), {})
+        else:
+            table = _OPTION_IDS[field]
+        option_id = table.get(survey.get(field))
+        if option_id is None:
+            return None
+        ids.append(option_id)
+    return tuple(ids)
+
+
+def _compile_decision_table() -> Dict[str, Dict[Tuple[int, ...], Any]]:
+    """규칙 함수를 선택지 ID 조합별로 한 번씩 평가해 둔 결정 테이블
+
+    각 결과 항목은 실제로 의존하는 설문 항목의 ID 조합으로만 색인한다
+    (상태 5 + 직무×강점 24 + 직무×전공×회화×이해도 216 + 산업×세부×직무×강점 144 항목: 면접 질문·관련 질문·키워드).
+    """
+    n_sub = {INDUSTRY_OPTIONS.index(industry): len(options) for industry, options in SUB_INDUSTRY_OPTIONS.items()}
+    table: Dict[str, Dict[Tuple[int, ...], Any]] = {
+        "status_tip": {(s,): _status_tip(status) for s, status in enumerate(STATUS_OPTIONS)},
+        "core_advice": {},
+        "complement_tips": {},
+        "interview_questions": {},
+        "related_questions": {},
+        "keywords": {},
+    }
+    for r, job_role in enumerate(JOB_ROLE_OPTIONS):
+        for g, strength in enumerate(STRENGTH_OPTIONS):
+            label = _strength_label(strength)
+            table["core_advice"][(r, g)] = JOB_STRENGTH_TIPS.get(job_role, {}).get(label, "") if label else ""
+        for m, major in enumerate(MAJOR_OPTIONS):
+            for b, biz_talk in enumerate(BIZ_TALK_OPTIONS):
+                for t, theory_level in enumerate(THEORY_LEVEL_OPTIONS):
+                    tips = _complement_tips(job_role, major, biz_talk, theory_level)
+                    table["complement_tips"][(r, m, b, t)] = tuple(tips)
+        for i, industry in enumerate(INDUSTRY_OPTIONS):
+            for sub_id in range(n_sub[i]):
+                sub_industry = SUB_INDUSTRY_OPTIONS[industry][sub_id]
+                for g, strength in enumerate(STRENGTH_OPTIONS):
+                    label = _strength_label(strength)
+                    keywords = build_keywords(industry, sub_industry, job_role, label or "")["keywords"]
+                    table["keywords"][(i, sub_id, r, g)] = tuple(keywords)
+                    questions = _interview_questions(industry, sub_industry, job_role, label, keywords)
+                    for field, value in questions.items():
+                        table[field][(i, sub_id, r, g)] = tuple(value)
+    return table
+
+
+_DECISION_TABLE = _compile_decision_table()
+_PROFILE_CACHE = LRUCache(256)
+
+
+def complement_tip_texts() -> List[str]:
+    """결정 테이블에 들어 있는 보완 조언 문장 전체 (중복 제거, 처음 나온 순서)"""
+    return list(dict.fromkeys(tip for tips in _DECISION_TABLE["complement_tips"].values() for tip in tips))
+
+
+def recommendation_profile(survey: Dict[str, Any]) -> Dict[str, Any]:
+    """추천 결과 중 설문에만 의존하는 부분 (설문 지문별 캐시, 결정 테이블 조회 / 선택지 밖 값은 규칙 평가)"""
+    fingerprint = tuple(survey.get(field) for field in SURVEY_FIELDS)
+    cached = _PROFILE_CACHE.get(fingerprint)
+    if cached is None:
+        ids = survey_option_ids(survey)
+        if ids is None:
+            profile = _profile_from_rules(*fingerprint)
+            cached = {key: tuple(value) if isinstance(value, list) else value for key, value in profile.items()}
+        else:
+            i, sub_id, s, m, r, g, b, t = ids
+            cached = {
+                "status_tip": _DECISION_TABLE["status_tip"][(s,)],
+                "core_advice": _DECISION_TABLE["core_advice"][(r, g)],
+                "complement_tips": _DECISION_TABLE["complement_tips"][(r, m, b, t)],
+                "interview_questions": _DECISION_TABLE["interview_questions"][(i, sub_id, r, g)],
+                "related_questions": _DECISION_TABLE["related_questions"][(i, sub_id, r, g)],
+                "keywords": _DECISION_TABLE["keywords"][(i, sub_id, r, g)],
+            }
+        _PROFILE_CACHE.put(fingerprint, cached)
+    # 캐시된 튜플은 공유되므로 호출자에게는 새 리스트로 넘긴다.
+    return {key: list(value) if isinstance(value, tuple) else value for key, value in cached.items()}
+
+
+def generate_recommendation(trends: Dict[str, Any], survey: Dict[str, Any]) -> Dict[str, Any]:
+    """산업 데이터 + 설문 응답 기반 종합 가이드 생성 (설문 의존 부분은 결정 테이블 조회)"""
+    result: Dict[str, Any] = {}
+
+    # 1) 산업 기상도 설명
+    result["market_summary"] = describe_market(trends)
+    if "forecast_years" in trends:
+        result["market_outlook"] = describe_market(trends, use_forecast=True)
+
+    # 2)~7) 상태 진단 조언, 직무×강점 조언, 보완 조언, 예상 면접 질문(프로필 유사도 순), 관련 질문, 키워드 클라우드
+    result.update(recommendation_profile(survey))
+    return result
+
+
+# 추천 결과 항목별로 의존하는 설문 축 (SURVEY_FIELDS 위치). market_*는 산업 축에만 의존한다.
+_RESULT_FIELD_AXES = {
+    "market_summary": (0,),
+    "market_outlook": (0,),
+    "status_tip": (2,),
+    "core_advice": (4, 5),
+    "complement_tips": (4, 3, 6, 7),
+    "interview_questions": (0, 1, 4, 5),
+    "related_questions": (0, 1, 4, 5),
+    "keywords": (0, 1, 4, 5),
+}
+# generate_recommendation 결과 키 (배치 출력 컬럼 순서)
+RESULT_FIELDS = list(_RESULT_FIELD_AXES)
+SURVEY_DIMS = (
+    len(INDUSTRY_OPTIONS),
+    max(len(options) for options in SUB_INDUSTRY_OPTIONS.values()),
+    len(STATUS_OPTIONS),
+    len(MAJOR_OPTIONS),
+    len(JOB_ROLE_OPTIONS),
+    len(STRENGTH_OPTIONS),
+    len(BIZ_TALK_OPTIONS),
+    len(THEORY_LEVEL_OPTIONS),
+)
+
+
+class RecommendationTable:
+    """모든 설문 조합(선택지 ID 혼합 기수 번호)의 generate_recommendation 결과를 담는 압축 테이블
+
+    결과 문자열·목록은 항목별로 한 번씩만 저장하고, 조합마다 항목별 구성요소 번호만 int16 행렬(조합 수 × 항목 수)에 둔다.
+    번호 -1은 해당 항목이 없음(전망 없음, 존재하지 않는 세부 분야 조합)을 뜻한다.
+    """
+
+    def __init__(self, market: Dict[int, Dict[str, Any]]):
+        self.fields = list(RESULT_FIELDS)
+        self.components: Dict[str, List[Any]] = {field: [] for field in self.fields}
+        self.ids = np.empty((int(np.prod(SURVEY_DIMS)), len(self.fields)), dtype=np.int16)
+
+        sources: Dict[str, Dict[Tuple[int, ...], Any]] = {
+            "market_summary": {(i,): value["market_summary"] for i, value in market.items()},
+            "market_outlook": {(i,): value["market_outlook"] for i, value in market.items() if "market_outlook" in value},
+        }
+        sources.update(_DECISION_TABLE)
+        for col, field in enumerate(self.fields):
+            axes = _RESULT_FIELD_AXES[field]
+            local = np.full([SURVEY_DIMS[axis] for axis in axes], -1, dtype=np.int16)
+            interned: Dict[Any, int] = {}
+            for option_ids, value in sources[field].items():
+                if value not in interned:
+                    interned[value] = len(self.components[field])
+                    self.components[field].append(value)
+                local[option_ids] = interned[value]
+            # 의존하는 축만 가진 작은 배열을 전체 조합 공간으로 브로드캐스트한다.
+            shape = [SURVEY_DIMS[axis] if axis in axes else 1 for axis in range(len(SURVEY_DIMS))]
+            order = np.argsort(axes)
+            expanded = local.transpose(order).reshape(shape)
+            self.ids[:, col] = np.broadcast_to(expanded, SURVEY_DIMS).ravel()
+
+    def lookup(self, option_ids: Tuple[int, ...]) -> Optional[Dict[str, Any]]:
+        """선택지 ID 튜플 → generate_recommendation과 같은 결과 (산업 분석이 불가능한 조합은 None)"""
+        row = self.ids[np.ravel_multi_index(option_ids, SURVEY_DIMS)]
+        result: Dict[str, Any] = {}
+        for field, component in zip(self.fields, row):
+            if component < 0:
+                if field == "market_outlook":
+                    continue
+                return None
+            value = self.components[field][component]
+            result[field] = list(value) if isinstance(value, tuple) else value
+        return result
+
+
+def build_recommendation_table(df: pd.DataFrame, start_year: int) -> RecommendationTable:
+    """산업별 추세(대시보드와 같은 analyze_trends + forecast_industry)로 전체 설문 조합 결과 테이블 생성"""
+    market: Dict[int, Dict[str, Any]] = {}
+    for i, industry in enumerate(INDUSTRY_OPTIONS):
+        trends = analyze_trends(df, industry, start_year)
+        if not trends:
+            continue
+        trends.update(forecast_industry(df, industry, start_year))
+        market[i] = generate_recommendation(trends, {})
+    return RecommendationTable(market)
+
+
+# 추천 테이블 사전 계산은 첫 화면을 막지 않도록 백그라운드 스레드 하나에서 순서대로 처리한다.
+_WARMUP_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="recommendation-warmup")
+_WARMUP_LOCK = threading.Lock()
+_RECOMMENDATION_TABLES = LRUCache(8)
+
+
+def warm_recommendation_table(df: pd.DataFrame, start_year: int) -> Future:
+    """(데이터셋 버전, 시작 연도)별 추천 테이블 생성을 백그라운드에 한 번만 예약"""
+    key = (dataset_key(df), start_year)
+    with _WARMUP_LOCK:
+        future = _RECOMMENDATION_TABLES.get(key)
+        if future is None:
+            future = _WARMUP_EXECUTOR.submit(build_recommendation_table, df, start_year)
+            _RECOMMENDATION_TABLES.put(key, future)
+    return future
+
+
+def lookup_recommendation(df: pd.DataFrame, start_year: int, survey: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """준비된 추천 테이블에서 결과 조회 (테이블 생성 중·실패, 선택지 밖 응답이면 None)"""
+    future = _RECOMMENDATION_TABLES.get((dataset_key(df), start_year))
+    if future is None or not future.done() or future.exception() is not None:
+        return None
+    option_ids = survey_option_ids(survey)
+    if option_ids is None:
+        return None
+    return future.result().lookup(option_ids)
@@ -0,0 +1,100 @@
+"""근무지 지역 계층: 기업 '위치' 문구 → (시/도, 시/군/구, 사업장) 정규화와 통근권 구분"""
+
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# 통근권 (선택지 순서 = 화면 표시 순서): 통근권 → 시/도
+COMMUTE_ZONES: Dict[str, Tuple[str, ...]] = {
+    "수도권": ("서울", "경기", "인천"),
+    "충청권": ("대전", "세종", "충남", "충북"),
+}
+OTHER_ZONE = "기타"
+ANY_REGION = "지역 무관"
+REGION_OPTIONS = [ANY_REGION] + list(COMMUTE_ZONES)
+
+PROVINCES = ("서울", "경기", "인천", "대전", "세종", "충남", "충북", "강원", "전북", "전남", "경북", "경남", "부산", "대구", "광주", "울산", "제주")
+
+# 시/군/구 → 시/도 (시는 '시'를 뺀 이름, 광역시의 구는 '구'를 붙인 이름)
+CITY_PROVINCE: Dict[str, str] = {
+    "화성": "경기",
+    "평택": "경기",
+    "용인": "경기",
+    "이천": "경기",
+    "부천": "경기",
+    "성남": "경기",
+    "천안": "충남",
+    "아산": "충남",
+    "공주": "충남",
+    "청주": "충북",
+    "음성": "충북",
+    "괴산": "충북",
+    "서초구": "서울",
+    "강남구": "서울",
+    "유성구": "대전",
+}
+
+# 통칭 지명 → (시/군/구, 사업장 이름): 판교는 성남, 동탄은 화성 소재 사업장으로 정규화한다.
+LOCATION_ALIASES: Dict[str, Tuple[str, str]] = {
+    "판교": ("성남", "판교"),
+    "동탄": ("화성", "동탄"),
+    "기흥": ("용인", "기흥"),
+    "온양": ("아산", "온양"),
+    "오창": ("청주", "오창"),
+    "양재": ("서초구", "양재"),
+    "강남": ("강남구", ""),
+    "유성": ("유성구", ""),
+}
+
+
+class Site(NamedTuple):
+    """정규화된 근무지 한 곳"""
+
+    province: str
+    city: str
+    site: str
+
+
+_SEGMENT = re.compile(r"^\s*(?:(?P<province>\S+)\s+)?(?P<place>[^\s(]+)\s*(?:\((?P<detail>[^)]*)\))?\s*$")
+
+
+def commute_zone(province: str) -> str:
+    """시/도 → 통근권 (수도권/충청권/기타)"""
+    for zone, provinces in COMMUTE_ZONES.items():
+        if province in provinces:
+            return zone
+    return OTHER_ZONE
+
+
+def parse_location(text: Optional[str]) -> List[Site]:
+    """'경기 화성(DSR/Line), 평택(고덕), 충북 청주(흥덕구 - NAND)' 같은 위치 문구 → Site 목록
+
+    시/도는 지명 사전(CITY_PROVINCE)으로 정하고, 사전에 없는 지명만 앞에 적힌 시/도(없으면 직전 구간의 시/도)를 따른다.
+    괄호 안 설명은 사업장 이름으로 둔다. 해석하지 못한 구간은 건너뛴다.
+    """
+    sites: List[Site] = []
+    current_province = ""
+    for segment in (text or "").split(","):
+        match = _SEGMENT.match(segment)
+        if match is None:
+            continue
+        province, place, detail = match.group("province"), match.group("place"), (match.group("detail") or "").strip()
+        if province is not None and province not in PROVINCES:
+            continue
+        site = detail
+        if place in LOCATION_ALIASES:
+            place, alias_site = LOCATION_ALIASES[place]
+            site = " ".join(part for part in (alias_site, detail) if part)
+        place_province = CITY_PROVINCE.get(place)
+        if place_province is None and place in PROVINCES:
+            # '서울'처럼 시/도만 적힌 구간
+            place_province, place = place, ""
+        current_province = place_province or province or current_province
+        if current_province:
+            sites.append(Site(current_province, place, site))
+    return sites
+
+
+def format_site(site: Site) -> str:
+    """Site → '경기 화성 (동탄)' 표시 문자열"""
+    label = " ".join(part for part in (site.province, site.city) if part)
+    return f"{label} ({site.site})" if site.site else label
@@ -0,0 +1,54 @@
+"""산업별 지표 레지스트리 (지표 → CSV 컬럼·단위·집계 방식)"""
+
+from typing import Any, Dict
+
+
+# 산업별 지표 레지스트리: 새 산업(2차전지 등)은 분기 추가 없이 여기에 항목만 등록한다.
+# aggregation: 같은 연도의 여러 행(월/분기)을 묶을 때 유량 지표는 "sum", 점유율·가격은 "mean"
+METRIC_REGISTRY: Dict[str, Dict[str, Dict[str, str]]] = {
+    "반도체": {
+        "production": {"column": "반도체_생산(조원)", "label": "생산", "unit": "조원", "aggregation": "sum"},
+        "share": {"column": "반도체_시장점유율(퍼센트)", "label": "시장 점유율", "unit": "%", "aggregation": "mean"},
+        "export": {"column": "반도체_수출(억불)", "label": "수출", "unit": "억불", "aggregation": "sum"},
+        "price": {"column": "DRAM_가격(달러)", "label": "DRAM 가격", "unit": "달러", "aggregation": "mean"},
+    },
+    "디스플레이": {
+        "production": {"column": "디스플레이_생산(조원)", "label": "생산", "unit": "조원", "aggregation": "sum"},
+        "share": {"column": "디스플레이_시장점유율(퍼센트)", "label": "시장 점유율", "unit": "%", "aggregation": "mean"},
+        "export": {"column": "디스플레이_수출(억불)", "label": "수출", "unit": "억불", "aggregation": "sum"},
+        "price": {
+            "column": "액정표시장치(LCD)_평균가격(달러)",
+            "label": "LCD 평균가격",
+            "unit": "달러",
+            "aggregation": "mean",
+        },
+    },
+}
+
+
+def metric_specs(industry: str) -> Dict[str, Dict[str, str]]:
+    """산업의 지표 정의 (미등록 산업은 '<산업>_생산(조원)' 등 기본 명명 규칙, 가격 지표 없음)"""
+    if industry in METRIC_REGISTRY:
+        return METRIC_REGISTRY[industry]
+    return {
+        "production": {"column": f"{industry}_생산(조원)", "label": "생산", "unit": "조원", "aggregation": "sum"},
+        "share": {"column": f"{industry}_시장점유율(퍼센트)", "label": "시장 점유율", "unit": "%", "aggregation": "mean"},
+        "export": {"column": f"{industry}_수출(억불)", "label": "수출", "unit": "억불", "aggregation": "sum"},
+    }
+
+
+# analyze_trends / step1_target_setting 이 실제로 읽는 지표 컬럼
+TREND_COLUMNS = [spec["column"] for metrics in METRIC_REGISTRY.values() for spec in metrics.values()]
+# 같은 연도의 여러 행(월/분기)을 합산하는 유량 지표 (나머지 점유율·가격은 평균)
+FLOW_COLUMNS = {
+    spec["column"]
+    for metrics in METRIC_REGISTRY.values()
+    for spec in metrics.values()
+    if spec["aggregation"] == "sum"
+}
+# 레지스트리 밖 컬럼은 이름으로 유량 여부를 판단한다.
+_FLOW_KEYWORDS = ("생산", "수출", "수입", "출하")
+
+
+def _is_flow_column(col: Any) -> bool:
+    return col in FLOW_COLUMNS or (col not in TREND_COLUMNS and any(k in str(col) for k in _FLOW_KEYWORDS))
@@ -0,0 +1,118 @@
+"""기업 카탈로그·조언·면접 질문 전문 검색: 문자 2-gram 역색인 + BM25 순위"""
+
+import unicodedata
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .companies import COMPANY_CATALOG, COMPANY_TIERS
+from .questions import QUESTION_BANK
+from .recommend import JOB_STRENGTH_TIPS, STATUS_TIPS, complement_tip_texts
+from .text import char_bigrams, words
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+DEFAULT_SEARCH_RESULTS = 10
+SNIPPET_CHARS = 80
+
+
+class SearchIndex:
+    """문서 목록 + 2-gram → (문서 번호, BM25 가중치) 게시 목록
+
+    문서별 BM25 가중치(tf 포화·길이 정규화·idf)를 색인 시점에 미리 곱해 두므로,
+    질의 처리는 질의 2-gram의 게시 목록을 이어 붙여 np.bincount 한 번으로 점수를 더하는 것으로 끝난다.
+    """
+
+    def __init__(self, documents: Iterable[Dict[str, Any]]):
+        self.documents: List[Dict[str, Any]] = list(documents)
+        self.kinds = np.array([document["kind"] for document in self.documents], dtype=object)
+        n_docs = len(self.documents)
+        postings: Dict[str, tuple] = {}
+        lengths = np.zeros(n_docs, dtype=np.float64)
+        for doc_id, document in enumerate(self.documents):
+            grams = char_bigrams(document["title"] + " " + document["text"])
+            lengths[doc_id] = len(grams)
+            for gram, count in Counter(grams).items():
+                ids, counts = postings.setdefault(gram, ([], []))
+                ids.append(doc_id)
+                counts.append(count)
+
+        avg_length = lengths.mean() if n_docs else 0.0
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths / avg_length) if avg_length else np.full(n_docs, BM25_K1)
+        self.postings: Dict[str, tuple] = {}
+        for gram, (ids, counts) in postings.items():
+            ids = np.asarray(ids, dtype=np.int32)
+            tf = np.asarray(counts, dtype=np.float64)
+            idf = np.log(1 + (n_docs - len(ids) + 0.5) / (len(ids) + 0.5))
+            self.postings[gram] = (ids, (idf * tf * (BM25_K1 + 1) / (tf + norm[ids])).astype(np.float32))
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def search(self, query: str, k: int = DEFAULT_SEARCH_RESULTS, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """질의 → 점수 내림차순 상위 k개 {"document", "score", "snippet"} (kind로 문서 종류 제한 가능)
+
+        점수는 BM25 합에 질의 2-gram 중 문서에 들어 있는 비율을 곱한 값이라, 질의어를 모두 포함한 문서가 앞선다.
+        """
+        grams = list(dict.fromkeys(char_bigrams(query)))
+        hits = [self.postings[gram] for gram in grams if gram in self.postings]
+        if not hits:
+            return []
+        ids = np.concatenate([doc_ids for doc_ids, _ in hits])
+        scores = np.bincount(ids, weights=np.concatenate([weights for _, weights in hits]), minlength=len(self))
+        coverage = np.bincount(ids, minlength=len(self)) / len(grams)
+        scores *= coverage
+        if kind is not None:
+            scores[self.kinds != kind] = 0
+
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        # 점수 내림차순, 동점이면 문서 순서
+        candidates = candidates[np.lexsort((candidates, -scores[candidates]))]
+        query_words = words(query)
+        return [
+            {"document": self.documents[i], "score": float(scores[i]), "snippet": _snippet(self.documents[i]["text"], query_words)}
+            for i in candidates
+        ]
+
+
+def _snippet(text: str, query_words: List[str]) -> str:
+    """질의어가 처음 나오는 위치 주변 SNIPPET_CHARS 글자 (없으면 앞부분)"""
+    flat = " ".join(text.split())
+    lowered = unicodedata.normalize("NFKC", flat).lower()
+    positions = [pos for pos in (lowered.find(word) for word in query_words) if pos >= 0]
+    start = max(0, min(positions) - SNIPPET_CHARS // 4) if positions else 0
+    snippet = flat[start : start + SNIPPET_CHARS]
+    return ("…" if start > 0 else "") + snippet + ("…" if start + SNIPPET_CHARS < len(flat) else "")
+
+
+def catalog_documents() -> List[Dict[str, Any]]:
+    """검색 대상 문서: 기업 카탈로그, 시기별 조언, 직무×강점 조언, 보완 조언, 예상 면접 질문"""
+    tier_titles = {tier: title for tier, title, _ in COMPANY_TIERS}
+    documents: List[Dict[str, Any]] = []
+    for company in COMPANY_CATALOG.records:
+        text = " / ".join(company.get(field, "") for field in ("주력", "위치", "스펙", "Tip") if company.get(field))
+        documents.append(
+            {"kind": "기업", "title": company["기업"], "text": text, "source": tier_titles.get(company.get("tier"), ""), "link": company.get("링크")}
+        )
+    for title, tip in STATUS_TIPS.items():
+        documents.append({"kind": "시기 조언", "title": title, "text": tip})
+    for job_role, tips in JOB_STRENGTH_TIPS.items():
+        for strength_label, tip in tips.items():
+            documents.append({"kind": "직무·강점 전략", "title": f"{job_role} × {strength_label}", "text": tip})
+    documents.extend({"kind": "보완 포인트", "title": "보완 포인트", "text": tip} for tip in complement_tip_texts())
+    for record in QUESTION_BANK.records:
+        topics = ", ".join(record.get("topics", []))
+        documents.append({"kind": "면접 질문", "title": f"면접 질문 ({topics})" if topics else "면접 질문", "text": record["question"]})
+    return documents
+
+
+# 앱 시작 시 한 번 색인한다 (카탈로그·조언은 실행 중 바뀌지 않음).
+SEARCH_INDEX = SearchIndex(catalog_documents())
+
+
+def search_catalog(query: str, k: int = DEFAULT_SEARCH_RESULTS, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+    """기본 색인에서 기업·조언·면접 질문 검색"""
+    return SEARCH_INDEX.search(query, k, kind)
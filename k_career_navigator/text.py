@@ -0,0 +1,26 @@
+"""한국어 텍스트 색인어: 어절별 글자 2-gram (전문 검색·질문 유사도 공용)
+
+한국어는 띄어쓰기만으로 형태소를 나누기 어려우므로, 어절마다 글자 2-gram(한 글자 어절은 그대로)을 색인어로 쓴다.
+"""
+
+import re
+import unicodedata
+from typing import List
+
+_WORD_PATTERN = re.compile(r"[0-9A-Za-z가-힣ㄱ-ㆎ]+")
+
+
+def words(text: str) -> List[str]:
+    """NFKC 정규화·소문자화한 텍스트의 어절(한글·영문·숫자 연속 구간) 목록"""
+    return _WORD_PATTERN.findall(unicodedata.normalize("NFKC", text).lower())
+
+
+def char_bigrams(text: str) -> List[str]:
+    """텍스트 → 어절별 글자 2-gram 목록 (중복 포함, 한 글자 어절은 그 글자)"""
+    grams: List[str] = []
+    for word in words(text):
+        if len(word) == 1:
+            grams.append(word)
+        else:
+            grams.extend(word[i : i + 2] for i in range(len(word) - 1))
+    return grams
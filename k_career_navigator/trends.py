@@ -0,0 +1,622 @@
+"""산업 추세 분석: CAGR, 추세 인덱스, 부트스트랩 신뢰구간, 전망, 시차 상관, 시장 국면"""
+
+import hashlib
+import threading
+from statistics import NormalDist
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .cache import LRUCache, _MISSING, dataset_key, register_dataset
+from .data import as_annual, dataset_frequency, parse_numeric, replace_cached_dataset, validate_dataset
+from .registry import metric_specs
+
+
+def get_cagr(series: pd.Series) -> float:
+    """연평균 성장률(CAGR) 계산 (semi.prd.md 로직 참고)"""
+    valid = series.dropna()
+    if len(valid) < 2:
+        return float("nan")
+    start_val = valid.iloc[0]
+    end_val = valid.iloc[-1]
+    num_years = len(valid) - 1
+    if start_val > 0 and num_years > 0:
+        return (end_val / start_val) ** (1 / num_years) - 1
+    elif start_val == 0 and end_val > 0:
+        return 1.0
+    else:
+        return float("nan")
+
+
+TREND_INDEX_MAX_ENTRIES = 4
+# 결과 대시보드의 분석 기간 선택지: 고정 시작 연도 또는 최근 N년
+TREND_WINDOWS: Dict[str, Dict[str, int]] = {
+    "2020년 이후": {"start_year": 2020},
+    "최근 3년": {"lookback": 3},
+    "최근 5년": {"lookback": 5},
+    "최근 10년": {"lookback": 10},
+}
+DEFAULT_TREND_WINDOW = "2020년 이후"
+
+
+def window_start_year(window_label: str, latest_year: int) -> int:
+    """분석 기간 라벨을 시작 연도로 변환"""
+    window = TREND_WINDOWS.get(window_label, TREND_WINDOWS[DEFAULT_TREND_WINDOW])
+    if "lookback" in window:
+        return int(latest_year) - window["lookback"]
+    return window["start_year"]
+
+
+def _cagr_from_endpoints(first: np.ndarray, last: np.ndarray, count: np.ndarray) -> np.ndarray:
+    """첫/마지막 유효값과 유효 개수로 CAGR 계산 (get_cagr와 동일한 경계 처리)"""
+    enough = count >= 2
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        growth = (last / first) ** (1 / np.maximum(count - 1, 1)) - 1
+    return np.where(
+        enough & (first > 0),
+        growth,
+        np.where(enough & (first == 0) & (last > 0), 1.0, np.nan),
+    )
+
+
+class TrendIndex:
+    """데이터셋 버전당 한 번 만드는 (시작 연도 × 컬럼) 추세 인덱스
+
+    시작 행 i 이후의 첫 유효값(first_vals)과 i 이전까지의 유효 개수(prefix_counts)를 행렬로 들고 있어,
+    어떤 시작 연도든 모든 컬럼의 CAGR/최근값을 O(컬럼 수) 배열 연산으로 답한다.
+    같은 표현 덕분에 새 연도 행 추가(append)도 O(컬럼 수)로 반영된다.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        numeric = df.select_dtypes(include="number")
+        if not numeric.index.is_monotonic_increasing:
+            numeric = numeric.sort_index(kind="stable")
+        values = numeric.to_numpy(dtype=np.float64)
+        n_rows, n_cols = values.shape
+
+        self.columns = list(numeric.columns)
+        self.column_pos = {col: pos for pos, col in enumerate(self.columns)}
+        self._metric_positions: Dict[str, Dict[str, int]] = {}
+        self._size = n_rows
+        self._years = numeric.index.to_numpy()
+
+        mask = ~np.isnan(values)
+        # 각 행 이후(포함) 첫 유효값의 행 위치: 역방향 누적 최소값 (없으면 n_rows → NaN 패딩 행)
+        positions = np.where(mask, np.arange(n_rows)[:, None], n_rows)
+        next_valid = np.minimum.accumulate(positions[::-1], axis=0)[::-1]
+        padded = np.vstack([values, np.full((1, n_cols), np.nan)])
+        self._first_vals = padded[next_valid, np.arange(n_cols)]
+        self._prefix_counts = np.vstack(
+            [np.zeros((1, n_cols), dtype=np.int32), np.cumsum(mask, axis=0, dtype=np.int32)[:-1]]
+        )
+        self.total_counts = mask.sum(axis=0).astype(np.int32)
+
+        # 컬럼별 마지막 유효값 위치 (유효값이 없으면 -1)
+        self.last_pos = np.where(self.total_counts > 0, n_rows - 1 - mask[::-1].argmax(axis=0), -1)
+        self.last_vals = np.where(self.last_pos >= 0, padded[self.last_pos, np.arange(n_cols)], np.nan)
+        self.latest = values[-1].copy() if n_rows else np.full(n_cols, np.nan)
+        self._windows: Dict[int, Optional[Dict[str, np.ndarray]]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def n_rows(self) -> int:
+        return self._size
+
+    @property
+    def years(self) -> np.ndarray:
+        return self._years[: self._size]
+
+    @property
+    def first_vals(self) -> np.ndarray:
+        return self._first_vals[: self._size]
+
+    @property
+    def prefix_counts(self) -> np.ndarray:
+        return self._prefix_counts[: self._size]
+
+    def window(self, start_year: int) -> Optional[Dict[str, np.ndarray]]:
+        """시작 연도 이후 구간의 컬럼별 cagr/first/last/count/latest 배열 (행이 2개 미만이면 None)"""
+        with self._lock:
+            if start_year in self._windows:
+                return self._windows[start_year]
+            start = int(np.searchsorted(self.years, start_year, side="left"))
+            result = None
+            if self.n_rows - start >= 2:
+                count = self.total_counts - self._prefix_counts[start]
+                first = self._first_vals[start].copy()
+                last = np.where(count > 0, self.last_vals, np.nan)
+                result = {
+                    "cagr": _cagr_from_endpoints(first, last, count),
+                    "first": first,
+                    "last": last,
+                    "count": count,
+                    "latest": self.latest.copy(),
+                }
+            self._windows[start_year] = result
+            return result
+
+    def metric_positions(self, industry: str) -> Dict[str, int]:
+        """산업 지표(production/share/export/price) → 값 배열의 컬럼 위치 (데이터셋에 있는 지표만)"""
+        positions = self._metric_positions.get(industry)
+        if positions is None:
+            positions = {
+                metric: self.column_pos[spec["column"]]
+                for metric, spec in metric_specs(industry).items()
+                if spec["column"] in self.column_pos
+            }
+            self._metric_positions[industry] = positions
+        return positions
+
+    def _reserve(self, rows: int) -> None:
+        """행 용량을 두 배씩 늘려 append를 분할 상환 O(컬럼 수)로 유지"""
+        capacity = len(self._first_vals)
+        if rows <= capacity:
+            return
+        new_capacity = max(rows, capacity * 2, 8)
+        n_cols = len(self.columns)
+        first_vals = np.full((new_capacity, n_cols), np.nan)
+        first_vals[: self._size] = self._first_vals[: self._size]
+        prefix_counts = np.zeros((new_capacity, n_cols), dtype=np.int32)
+        prefix_counts[: self._size] = self._prefix_counts[: self._size]
+        years = np.zeros(new_capacity, dtype=np.result_type(self._years.dtype, np.int16))
+        years[: self._size] = self._years[: self._size]
+        self._first_vals, self._prefix_counts, self._years = first_vals, prefix_counts, years
+
+    def append(self, year: int, row: np.ndarray) -> None:
+        """새 연도 한 행(self.columns 순서의 값 배열)을 반영하고 구간 결과 메모를 무효화"""
+        row = np.asarray(row, dtype=np.float64)
+        if row.shape != (len(self.columns),):
+            raise ValueError("추가 행의 컬럼 수가 추세 인덱스와 일치하지 않습니다.")
+        with self._lock:
+            if self._size and year <= self._years[self._size - 1]:
+                raise ValueError("추가 행의 연도는 기존 마지막 연도 이후여야 합니다.")
+            r = self._size
+            self._reserve(r + 1)
+            valid = ~np.isnan(row)
+
+            # 아직 유효값이 없던 뒤쪽 구간(마지막 유효 위치 다음부터)의 첫 유효값을 새 값으로 채운다.
+            for col in np.nonzero(valid & (self.last_pos < r - 1))[0]:
+                self._first_vals[self.last_pos[col] + 1 : r, col] = row[col]
+            self._first_vals[r] = row
+            self._prefix_counts[r] = self.total_counts
+            self._years[r] = year
+            self._size = r + 1
+
+            self.total_counts = self.total_counts + valid
+            self.last_pos = np.where(valid, r, self.last_pos)
+            self.last_vals = np.where(valid, row, self.last_vals)
+            self.latest = row.copy()
+            # 모든 구간이 새 행을 포함하므로 메모된 구간 결과는 전부 무효
+            self._windows.clear()
+
+
+_TREND_INDEX_CACHE = LRUCache(TREND_INDEX_MAX_ENTRIES)
+
+
+def get_trend_index(df: pd.DataFrame) -> TrendIndex:
+    """데이터셋 버전 키별 추세 인덱스 (버전이 바뀔 때만 다시 생성, 월/분기 데이터는 연 집계 기준)"""
+    df = as_annual(df)
+    key = dataset_key(df)
+    index = _TREND_INDEX_CACHE.get(key)
+    if index is None:
+        index = TrendIndex(df)
+        _TREND_INDEX_CACHE.put(key, index)
+    return index
+
+
+def append_year_rows(df: pd.DataFrame, new_rows: pd.DataFrame) -> pd.DataFrame:
+    """새로 발표된 연도 행만 받아 데이터셋을 확장하고, 추세 인덱스는 다시 만들지 않고 O(컬럼 수)로 갱신
+
+    new_rows는 '연도' 컬럼 또는 연도 인덱스를 가진다. 반환되는 DataFrame은 새 버전 키로 등록되며,
+    이 데이터셋을 들고 있던 데이터 캐시 항목만 새 버전으로 교체된다.
+    """
+    if dataset_frequency(df) != "Y":
+        raise ValueError("월/분기 데이터셋은 연도 행 추가를 지원하지 않습니다. 원본 CSV를 다시 올려 주세요.")
+    if "연도" in new_rows.columns:
+        new_rows = new_rows.assign(연도=pd.to_numeric(new_rows["연도"], errors="coerce"))
+        new_rows = new_rows.dropna(subset=["연도"]).set_index("연도")
+    new_rows = new_rows.sort_index(kind="stable")
+    unknown = [col for col in new_rows.columns if col not in df.columns]
+    if unknown:
+        raise ValueError(f"기존 데이터셋에 없는 컬럼은 추가할 수 없습니다: {unknown}")
+
+    aligned = new_rows.reindex(columns=df.columns)
+    aligned = pd.DataFrame(
+        {col: parse_numeric(aligned[col]).astype(df[col].dtype) for col in df.columns},
+        index=pd.Index(aligned.index.to_numpy().astype(df.index.dtype), name=df.index.name),
+    )
+    # 인덱스를 갱신하기 전에 확인한다: 같은 연도가 두 번 들어가면 CAGR 기간과 최근값이 어긋난다.
+    years = aligned.index.to_numpy()
+    if len(years) and ((len(df.index) and years[0] <= df.index.max()) or (np.diff(years) <= 0).any()):
+        raise ValueError("추가 행의 연도는 기존 마지막 연도 이후여야 하며, 서로 겹칠 수 없습니다.")
+
+    old_key = dataset_key(df)
+    index = _TREND_INDEX_CACHE.pop(old_key)
+    if index is None:
+        index = TrendIndex(df)
+    positions = [aligned.columns.get_loc(col) for col in index.columns]
+    values = aligned.to_numpy(dtype=np.float64)[:, positions]
+    for year, row in zip(aligned.index, values):
+        index.append(year, row)
+
+    combined = pd.concat([df, aligned])
+    combined.attrs = dict(df.attrs)
+    if "validation_report" in df.attrs:
+        previous = df.attrs["validation_report"]["columns"]
+        combined.attrs["validation_report"] = validate_dataset(
+            combined, {col: previous.get(str(col), {}).get("non_numeric", 0) for col in combined.columns}
+        )
+        combined.attrs["validation_report"]["renamed_columns"] = df.attrs["validation_report"].get("renamed_columns", {})
+        combined.attrs["validation_report"]["rejected_columns"] = df.attrs["validation_report"].get("rejected_columns", {})
+    row_digest = hashlib.blake2b(pd.util.hash_pandas_object(aligned, index=True).to_numpy().tobytes(), digest_size=16)
+    new_key = ("append", old_key, row_digest.hexdigest())
+    register_dataset(combined, new_key)
+    _TREND_INDEX_CACHE.put(new_key, index)
+
+    # 같은 원본(업로드/기본 CSV)을 여는 세션이 재계산 없이 새 버전을 받도록 해당 데이터 캐시 항목만 교체
+    replace_cached_dataset(old_key, combined)
+    return combined
+
+
+def analyze_trends(df: pd.DataFrame, industry_prefix: str, start_year: int = 2020) -> Optional[Dict[str, Any]]:
+    """시작 연도(기본 2020년) 이후 생산/점유율/수출/가격 CAGR 및 최근값, 가격 이름 반환"""
+    index = get_trend_index(df)
+    window = index.window(start_year)
+    if window is None:
+        return None
+
+    trends: Dict[str, Any] = {}
+    for metric, pos in index.metric_positions(industry_prefix).items():
+        trends[f"{metric}_cagr"] = window["cagr"][pos]
+        trends[f"{metric}_latest"] = window["latest"][pos]
+        if metric == "price":
+            trends["price_name"] = metric_specs(industry_prefix)["price"]["label"]
+
+    return trends
+
+
+BOOTSTRAP_RESAMPLES = 2000
+BOOTSTRAP_CONFIDENCE = 0.95
+_BOOTSTRAP_CACHE = LRUCache(16)
+
+
+def _sorted_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """추세 인덱스와 같은 컬럼·행 순서의 수치 컬럼 DataFrame (연 집계 기준, 연도 오름차순)"""
+    numeric = as_annual(df).select_dtypes(include="number")
+    if not numeric.index.is_monotonic_increasing:
+        numeric = numeric.sort_index(kind="stable")
+    return numeric
+
+
+def _window_frame(df: pd.DataFrame, start_year: int) -> pd.DataFrame:
+    """시작 연도 이후 행만 남긴 _sorted_numeric"""
+    numeric = _sorted_numeric(df)
+    return numeric[numeric.index >= start_year]
+
+
+def _window_values(df: pd.DataFrame, start_year: int) -> np.ndarray:
+    return _window_frame(df, start_year).to_numpy(dtype=np.float64)
+
+
+def _nan_quantiles(samples: np.ndarray, quantiles: List[float]) -> List[np.ndarray]:
+    """열별 NaN 제외 분위수 (정렬 한 번 + 선형 보간, np.nanpercentile의 열 단위 루프 회피)"""
+    ordered = np.sort(samples, axis=0)  # NaN은 각 열의 끝으로 정렬된다.
+    n_valid = (~np.isnan(samples)).sum(axis=0)
+    cols = np.arange(samples.shape[1])
+    results = []
+    for q in quantiles:
+        position = q * np.maximum(n_valid - 1, 0)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.minimum(lower + 1, np.maximum(n_valid - 1, 0))
+        frac = position - lower
+        value = ordered[lower, cols] * (1 - frac) + ordered[upper, cols] * frac
+        results.append(np.where(n_valid > 0, value, np.nan))
+    return results
+
+
+def bootstrap_cagr_intervals(
+    df: pd.DataFrame,
+    start_year: int = 2020,
+    n_resamples: int = BOOTSTRAP_RESAMPLES,
+    confidence: float = BOOTSTRAP_CONFIDENCE,
+    seed: int = 0,
+) -> Optional[Dict[str, np.ndarray]]:
+    """모든 컬럼 CAGR의 부트스트랩 신뢰구간 (low/high 배열, 추세 인덱스 컬럼 순서, 데이터셋 버전별 캐시)
+
+    연간 로그 성장률을 복원 추출한 표본 평균으로 CAGR 분포를 만든다. 재표본마다 반복하지 않고
+    재표본별 추출 횟수 행렬(B × 구간 수)과 성장률 행렬(구간 수 × 컬럼)의 곱 한 번으로 모든 표본을 계산한다.
+    """
+    key = (dataset_key(df), start_year, n_resamples, confidence, seed)
+    cached = _BOOTSTRAP_CACHE.get(key, _MISSING)
+    if cached is not _MISSING:
+        return cached
+
+    values = _window_values(df, start_year)
+    n_rows, n_cols = values.shape
+    result = None
+    if n_rows >= 2:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_values = np.log(np.where(values > 0, values, np.nan))
+        valid = ~np.isnan(log_values)
+        # 직전 유효 행 위치 (forward fill): 결측을 건너뛰어 get_cagr처럼 유효값끼리 잇는다.
+        last_valid = np.maximum.accumulate(np.where(valid, np.arange(n_rows)[:, None], -1), axis=0)
+        prev = last_valid[:-1]
+        has_return = valid[1:] & (prev >= 0)
+        prev_log = log_values[np.maximum(prev, 0), np.arange(n_cols)]
+        returns = np.where(has_return, log_values[1:] - prev_log, 0.0)
+
+        n_steps = n_rows - 1
+        rng = np.random.default_rng(seed)
+        draws = rng.multinomial(n_steps, np.full(n_steps, 1 / n_steps), size=n_resamples).astype(np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean_log_growth = (draws @ returns) / (draws @ has_return.astype(np.float64))
+        samples = np.expm1(mean_log_growth)
+
+        tail = (1 - confidence) / 2
+        low, high = _nan_quantiles(samples, [tail, 1 - tail])
+        result = {"low": low, "high": high}
+
+    _BOOTSTRAP_CACHE.put(key, result)
+    return result
+
+
+FORECAST_HORIZON = 3
+_FORECAST_CACHE = LRUCache(16)
+
+
+def forecast_trends(
+    df: pd.DataFrame, start_year: int = 2020, horizon: int = FORECAST_HORIZON
+) -> Optional[Dict[str, np.ndarray]]:
+    """모든 컬럼에 로그-선형 추세를 한 번에 적합해 1~horizon년 뒤 전망값과 연간 성장률 반환 (데이터셋 버전별 캐시)
+
+    결측·0 이하 값을 가중치 0으로 두는 가중 최소제곱을 컬럼 전체에 대해 합계 벡터 몇 개로 닫힌 형태로 푼다.
+    """
+    key = (dataset_key(df), start_year, horizon)
+    cached = _FORECAST_CACHE.get(key, _MISSING)
+    if cached is not _MISSING:
+        return cached
+
+    window = _window_frame(df, start_year)
+    result = None
+    if len(window) >= 2:
+        years = window.index.to_numpy(dtype=np.float64)
+        t = years - years[-1]
+        values = window.to_numpy(dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_values = np.log(np.where(values > 0, values, np.nan))
+        weights = (~np.isnan(log_values)).astype(np.float64)
+        log_values = np.nan_to_num(log_values)
+
+        s0 = weights.sum(axis=0)
+        s1 = t @ weights
+        s2 = (t * t) @ weights
+        sy = (weights * log_values).sum(axis=0)
+        sty = t @ (weights * log_values)
+        denom = s0 * s2 - s1 * s1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope = np.where((s0 >= 2) & (denom > 0), (s0 * sty - s1 * sy) / denom, np.nan)
+            intercept = (sy - slope * s1) / s0
+
+        steps = np.arange(1, horizon + 1, dtype=np.float64)
+        result = {
+            "years": (years[-1] + steps).astype(np.int64),
+            "values": np.exp(intercept + slope * steps[:, None]),
+            "growth": np.expm1(slope),
+        }
+
+    _FORECAST_CACHE.put(key, result)
+    return result
+
+
+def forecast_industry(df: pd.DataFrame, industry_prefix: str, start_year: int = 2020) -> Dict[str, Any]:
+    """산업 지표별 전망 연간 성장률(<지표>_forecast_cagr)과 전망값(<지표>_forecast) 반환"""
+    forecast = forecast_trends(df, start_year)
+    if forecast is None:
+        return {}
+    result: Dict[str, Any] = {"forecast_years": forecast["years"].tolist()}
+    for metric, pos in get_trend_index(df).metric_positions(industry_prefix).items():
+        result[f"{metric}_forecast_cagr"] = forecast["growth"][pos]
+        result[f"{metric}_forecast"] = forecast["values"][:, pos].tolist()
+    return result
+
+
+LEAD_LAG_MAX = 3
+# 상관계수를 계산할 최소 겹치는 기간 수, 선후행으로 보고할 최소 |r|와 유의수준 (시차 수만큼 본페로니 보정)
+LEAD_LAG_MIN_OVERLAP = 6
+LEAD_LAG_MIN_ABS_R = 0.5
+LEAD_LAG_ALPHA = 0.05
+_LEAD_LAG_CACHE = LRUCache(16)
+
+
+def _pairwise_corr(x: np.ndarray, y: np.ndarray, min_overlap: int) -> Tuple[np.ndarray, np.ndarray]:
+    """x(행 × p)와 y(행 × q)의 모든 열 쌍 피어슨 상관계수를 결측 쌍 제외(pairwise complete)로 행렬 곱 몇 번에 계산"""
+    mx = (~np.isnan(x)).astype(np.float64)
+    my = (~np.isnan(y)).astype(np.float64)
+    x0 = np.nan_to_num(x)
+    y0 = np.nan_to_num(y)
+    n = mx.T @ my
+    sx = x0.T @ my
+    sy = mx.T @ y0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = x0.T @ y0 - sx * sy / n
+        var_x = (x0 * x0).T @ my - sx * sx / n
+        var_y = mx.T @ (y0 * y0) - sy * sy / n
+        corr = cov / np.sqrt(var_x * var_y)
+    return np.where((n >= min_overlap) & (var_x > 0) & (var_y > 0), corr, np.nan), n
+
+
+def lead_lag_correlations(df: pd.DataFrame, max_lag: int = LEAD_LAG_MAX) -> Optional[Dict[str, Any]]:
+    """모든 가격 컬럼 × 생산/수출 컬럼 쌍의 시차 상관계수 (전년 대비 로그 변화율 기준, 데이터셋 버전별 캐시)
+
+    corr[k, i, j] = corr(가격_i[t], 물량_j[t + lags[k]]) 이며, lag > 0이면 가격이 물량보다 lag 기간 선행한다.
+    컬럼 쌍마다 pandas corr를 부르지 않고 lag마다 행렬 곱으로 모든 쌍을 한 번에 계산한다.
+    """
+    key = (dataset_key(df), max_lag)
+    cached = _LEAD_LAG_CACHE.get(key, _MISSING)
+    if cached is not _MISSING:
+        return cached
+
+    numeric = _sorted_numeric(df)
+    columns = [str(col) for col in numeric.columns]
+    price_pos = [i for i, col in enumerate(columns) if "가격" in col]
+    volume_pos = [i for i, col in enumerate(columns) if "생산" in col or "수출" in col]
+    result = None
+    if price_pos and volume_pos and len(numeric) > LEAD_LAG_MIN_OVERLAP:
+        values = numeric.to_numpy(dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            growth = np.diff(np.log(np.where(values > 0, values, np.nan)), axis=0)
+        prices, volumes = growth[:, price_pos], growth[:, volume_pos]
+        n_rows = len(growth)
+
+        lags = np.arange(-max_lag, max_lag + 1)
+        corr = np.full((len(lags), len(price_pos), len(volume_pos)), np.nan)
+        overlap = np.zeros_like(corr)
+        for k, lag in enumerate(lags):
+            if abs(lag) >= n_rows:
+                continue
+            if lag >= 0:
+                x, y = prices[: n_rows - lag], volumes[lag:]
+            else:
+                x, y = prices[-lag:], volumes[: n_rows + lag]
+            corr[k], overlap[k] = _pairwise_corr(x, y, LEAD_LAG_MIN_OVERLAP)
+        result = {
+            "lags": lags,
+            "corr": corr,
+            "overlap": overlap,
+            "price_columns": [columns[i] for i in price_pos],
+            "volume_columns": [columns[i] for i in volume_pos],
+        }
+
+    _LEAD_LAG_CACHE.put(key, result)
+    return result
+
+
+def lead_lag_summary(df: pd.DataFrame, industry_prefix: str) -> List[str]:
+    """선택 산업의 가격 지표가 생산·수출보다 몇 기간 선행/후행하는지 요약 문장 목록
+
+    |r|가 가장 큰 시차를 고르되, |r|가 LEAD_LAG_MIN_ABS_R 미만이거나 Fisher z 검정이 (시차 수로 보정한)
+    LEAD_LAG_ALPHA에서 유의하지 않으면 잡음으로 보고 '뚜렷한 선후행 없음'으로 적는다.
+    """
+    analysis = lead_lag_correlations(df)
+    specs = metric_specs(industry_prefix)
+    if analysis is None or "price" not in specs:
+        return []
+    price_col = specs["price"]["column"]
+    if price_col not in analysis["price_columns"]:
+        return []
+
+    i = analysis["price_columns"].index(price_col)
+    z_critical = NormalDist().inv_cdf(1 - LEAD_LAG_ALPHA / (2 * len(analysis["lags"])))
+    lines = []
+    for metric in ("production", "export"):
+        col = specs[metric]["column"]
+        if col not in analysis["volume_columns"]:
+            continue
+        j = analysis["volume_columns"].index(col)
+        series = analysis["corr"][:, i, j]
+        if np.all(np.isnan(series)):
+            continue
+        k = int(np.nanargmax(np.abs(series)))
+        lag, r, n = int(analysis["lags"][k]), float(series[k]), int(analysis["overlap"][k, i, j])
+        price_label, metric_label = specs["price"]["label"], specs[metric]["label"]
+        z = abs(np.arctanh(np.clip(r, -0.999999, 0.999999))) * np.sqrt(n - 3)
+        if abs(r) < LEAD_LAG_MIN_ABS_R or z < z_critical:
+            lines.append(f"{price_label} ↔ {metric_label}: 뚜렷한 선후행 없음 (최대 |r|={abs(r):.2f}, {n}개 기간)")
+            continue
+        if lag > 0:
+            relation = f"가격이 {lag}년 선행"
+        elif lag < 0:
+            relation = f"가격이 {-lag}년 후행"
+        else:
+            relation = "같은 해에 동행"
+        lines.append(f"{price_label} ↔ {metric_label}: {relation} (변화율 상관계수 r={r:+.2f})")
+    return lines
+
+
+# 산업 기상도 국면: describe_market과 연도별 타임라인이 같은 임계값·판정 순서를 공유한다.
+REGIME_THRESHOLD = 0.03
+REGIME_LABELS = ["초호황기", "증설 경쟁", "다운 사이클", "안정/정체", "변동성 확대", "판단 불가"]
+REGIME_MESSAGES = [
+    "초호황기(Super Cycle)에 가까운 국면으로, 생산과 가격이 함께 상승하는 구간입니다.",
+    "증설 경쟁 성격이 강한 국면으로, 생산은 늘지만 가격은 압박을 받는 상황입니다.",
+    "다운 사이클(불황기)에 가까운 구간으로, 구조조정·효율화와 차세대 기술 준비가 병행되는 시기입니다.",
+    "안정/정체 국면으로, 대규모 확장보다는 기술 고도화·효율화 중심의 채용이 이뤄집니다.",
+    "변동성이 큰 구간으로, 생산과 가격 지표의 방향성이 엇갈리고 있습니다.",
+    "데이터가 충분하지 않아 산업 기상도를 정교하게 판단하기 어렵습니다.",
+]
+REGIME_COLORS = ["#64FFDA", "#FFB86C", "#FF6B81", "#8892B0", "#9E74FF", "#233554"]
+REGIME_ROLLING_YEARS = 3
+_REGIME_CACHE = LRUCache(16)
+
+
+def classify_regimes(prod_cagr, price_cagr) -> np.ndarray:
+    """생산·가격 CAGR 배열을 국면 코드(REGIME_LABELS 위치) 배열로 분류 (if-elif 판정 순서 그대로)"""
+    prod = np.asarray(prod_cagr, dtype=np.float64)
+    price = np.asarray(price_cagr, dtype=np.float64)
+    t = REGIME_THRESHOLD
+    conditions = [
+        np.isnan(prod) | np.isnan(price),
+        (prod > t) & (price > t),
+        (prod > t) & (price < -t),
+        (prod < 0) & (price < -t),
+        (np.abs(prod) < t) & (np.abs(price) < t),
+    ]
+    return np.select(conditions, [5, 0, 1, 2, 3], default=4)
+
+
+def describe_market(trends: Dict[str, Any], use_forecast: bool = False) -> str:
+    """CAGR(또는 use_forecast=True면 전망 성장률)를 바탕으로 산업 기상도 성격 요약"""
+    suffix = "_forecast_cagr" if use_forecast else "_cagr"
+    prod_cagr = trends.get(f"production{suffix}", np.nan)
+    price_cagr = trends.get(f"price{suffix}", np.nan)
+    return REGIME_MESSAGES[int(classify_regimes(prod_cagr, price_cagr))]
+
+
+def regime_timeline(
+    df: pd.DataFrame, industry_prefix: str, window_years: int = REGIME_ROLLING_YEARS
+) -> Optional[pd.DataFrame]:
+    """연도별 직전 N년 생산·가격 롤링 CAGR과 국면을 배열 연산 한 번으로 계산 (데이터셋 버전별 캐시)
+
+    끝 연도 Y의 구간은 연도 [Y - N, Y]이며, analyze_trends와 같게 구간 안의 첫/마지막 유효값과 유효 개수로
+    CAGR을 구한다. 그래서 결측 연도 하나가 두 구간을 '판단 불가'로 만들지 않고, 연도가 빠진 행도 연도 기준으로 묶인다.
+    """
+    key = (dataset_key(df), industry_prefix, window_years)
+    cached = _REGIME_CACHE.get(key, _MISSING)
+    if cached is not _MISSING:
+        return cached
+
+    positions = get_trend_index(df).metric_positions(industry_prefix)
+    frame = _sorted_numeric(df)
+    timeline = None
+    if "production" in positions and "price" in positions and len(frame):
+        values = frame.to_numpy(dtype=np.float64)[:, [positions["production"], positions["price"]]]
+        years = frame.index.to_numpy(dtype=np.int64)
+        ends = np.flatnonzero(years >= years[0] + window_years)
+        if len(ends):
+            starts = np.searchsorted(years, years[ends] - window_years, side="left")
+            valid = ~np.isnan(values)
+            rows = np.arange(len(values))[:, None]
+            # 각 행에서 뒤로 가장 가까운 유효 행(prev_valid)과 앞으로 가장 가까운 유효 행(next_valid), 없으면 -1 / n
+            prev_valid = np.maximum.accumulate(np.where(valid, rows, -1), axis=0)
+            next_valid = np.minimum.accumulate(np.where(valid, rows, len(values))[::-1], axis=0)[::-1]
+            prefix = np.vstack([np.zeros((1, 2), dtype=np.int64), np.cumsum(valid, axis=0)])
+            count = prefix[ends + 1] - prefix[starts]
+            cols = np.arange(2)
+            first_row, last_row = next_valid[starts], prev_valid[ends]
+            first = np.where(count > 0, values[np.minimum(first_row, len(values) - 1), cols], np.nan)
+            last = np.where(count > 0, values[np.maximum(last_row, 0), cols], np.nan)
+            rolling = _cagr_from_endpoints(first, last, count)
+            codes = classify_regimes(rolling[:, 0], rolling[:, 1])
+            timeline = pd.DataFrame(
+                {
+                    "production_cagr": rolling[:, 0],
+                    "price_cagr": rolling[:, 1],
+                    "regime": codes,
+                    "label": np.asarray(REGIME_LABELS, dtype=object)[codes],
+                },
+                index=frame.index[ends],
+            )
+
+    _REGIME_CACHE.put(key, timeline)
+    return timeline
@@ -0,0 +1,55 @@
+"""배치 추천: 입력 형식별 설문 값 처리 테스트"""
+
+import io
+import json
+
+from k_career_navigator import recommend
+from k_career_navigator.batch import ERROR_FIELD, run_batch
+
+VALID = {
+    "sid": "S1",
+    "industry": "반도체",
+    "sub_industry": recommend.SUB_INDUSTRY_OPTIONS["반도체"][0],
+    "status": recommend.STATUS_OPTIONS[0],
+    "major": recommend.MAJOR_OPTIONS[0],
+    "job_role": recommend.JOB_ROLE_OPTIONS[0],
+    "strength": recommend.STRENGTH_OPTIONS[0],
+    "biz_talk": recommend.BIZ_TALK_OPTIONS[0],
+    "theory_level": recommend.THEORY_LEVEL_OPTIONS[0],
+}
+
+
+def _run(tmp_path, name, text, jsonl_out=True):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    out = io.StringIO()
+    total = run_batch(str(path), out, jsonl_out, workers=1)
+    return total, out.getvalue()
+
+
+def test_jsonl_non_string_values_are_coerced_or_reported(tmp_path, capsys):
+    rows = [
+        VALID,
+        {**VALID, "sid": "S2", "status": 3},
+        {**VALID, "sid": "S3", "job_role": ["R&D", "공정"]},
+        {"sid": "S4", "industry": "반도체", "theory_level": None},
+    ]
+    total, text = _run(tmp_path, "surveys.jsonl", "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows))
+    results = [json.loads(line) for line in text.splitlines()]
+    assert total == 4 and [row["sid"] for row in results] == ["S1", "S2", "S3", "S4"]
+
+    assert ERROR_FIELD not in results[0] and results[0]["interview_questions"]
+    # 숫자 응답은 문자열 '3'으로 바뀌어 선택지 밖 응답처럼 규칙으로 계산된다.
+    survey = {**VALID, "status": "3"}
+    assert results[1]["status_tip"] == recommend.recommendation_profile(survey)["status_tip"]
+    assert "job_role" in results[2][ERROR_FIELD] and "status_tip" not in results[2]
+    assert ERROR_FIELD not in results[3]
+    assert "3번째 행" in capsys.readouterr().err
+
+
+def test_jsonl_and_csv_give_the_same_recommendation(tmp_path):
+    header = ",".join(VALID)
+    line = ",".join(f'"{value}"' for value in VALID.values())
+    _, csv_text = _run(tmp_path, "surveys.csv", f"{header}\n{line}\n")
+    _, jsonl_text = _run(tmp_path, "surveys.jsonl", json.dumps(VALID, ensure_ascii=False) + "\n")
+    assert json.loads(csv_text) == json.loads(jsonl_text)
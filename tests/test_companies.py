@@ -0,0 +1,40 @@
+"""맞춤 기업 순위 테스트"""
+
+import pytest
+
+from k_career_navigator.companies import COMPANY_SCORE_WEIGHTS, CompanyCatalog
+
+RECORDS = [
+    {"기업": "A", "위치": "경기 화성", "tier": "Tier 1", "majors": ("전자공학",), "language": "기본", "roles": ("공정/제조/설비",)},
+    {"기업": "B", "위치": "충남 천안", "tier": "Tier 2", "majors": ("기계공학",), "language": "무관", "roles": ("공정/제조/설비",)},
+    {"기업": "C", "위치": "충북 청주", "tier": "Global", "majors": ("기계공학",), "language": "필수", "roles": ("공정/제조/설비",)},
+    {"기업": "D", "위치": "경기 판교", "tier": "Tier 1.5", "majors": (), "language": "필수", "roles": ()},
+]
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    return CompanyCatalog(RECORDS)
+
+
+def test_rank_orders_by_weighted_matches(catalog):
+    ranked = catalog.rank({"job_role": "공정/제조/설비", "major": "기계공학", "biz_talk": "불가능"})
+    weights = COMPANY_SCORE_WEIGHTS
+    assert [(r["company"]["기업"], r["score"]) for r in ranked] == [
+        ("B", weights["roles"] + weights["majors"]),
+        ("A", weights["roles"]),
+        ("C", weights["roles"] + weights["majors"] + weights["language_gap"]),
+    ]
+    assert "영어 회화 필수 (보완 필요)" in ranked[2]["reasons"]
+    # 어학 감점만 받은 D는 점수가 0 이하라 빠진다.
+    assert all(r["company"]["기업"] != "D" for r in ranked)
+
+
+def test_rank_filters_by_region(catalog):
+    survey = {"job_role": "공정/제조/설비", "preferred_region": "충청권"}
+    ranked = catalog.rank(survey)
+    assert [r["company"]["기업"] for r in ranked] == ["B", "C"]
+    assert all(site.province in ("충남", "충북") for r in ranked for site in r["sites"])
+    assert [r["company"]["기업"] for r in catalog.rank({**survey, "preferred_cities": ["경기 화성"]})] == ["A"]
+    # 카탈로그에 없는 통근권은 모든 기업을 걸러 낸다.
+    assert catalog.rank({**survey, "preferred_region": "제주권"}) == []
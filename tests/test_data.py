@@ -0,0 +1,160 @@
+"""CSV 로드·정규화 테스트"""
+
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from k_career_navigator import data
+from k_career_navigator.trends import analyze_trends
+
+
+def _monthly_csv(period_columns) -> bytes:
+    """2023~2024년 12개월 + 2025년 3개월, 매월 생산 30조원·수출 10억불인 월별 CSV"""
+    periods = pd.period_range("2023-01", "2025-03", freq="M")
+    frame = pd.DataFrame(period_columns(periods))
+    frame["반도체_생산(조원)"] = 30.0
+    frame["반도체_수출(억불)"] = 10.0
+    frame["반도체_시장점유율(퍼센트)"] = np.linspace(15, 17, len(periods)).round(2)
+    return frame.to_csv(index=False).encode("utf-8")
+
+
+PERIOD_LAYOUTS = {
+    "연월": lambda periods: {"연월": periods.strftime("%Y-%m")},
+    "연도+월": lambda periods: {"연도": periods.year, "월": periods.month},
+    "분기": lambda periods: {"기간": [f"{p.year}Q{p.quarter}" for p in periods]},
+}
+
+
+def _parse(raw: bytes, streaming: bool, monkeypatch):
+    with monkeypatch.context() as patch:
+        if streaming:
+            patch.setattr(data, "STREAMING_THRESHOLD_BYTES", 0)
+            patch.setattr(data, "STREAMING_CHUNK_ROWS", 4)
+        df, reason = data._parse_upload(io.BytesIO(raw), len(raw))
+    assert reason is None
+    return df
+
+
+@pytest.mark.parametrize("layout", list(PERIOD_LAYOUTS))
+def test_streaming_matches_in_memory(layout, monkeypatch):
+    raw = _monthly_csv(PERIOD_LAYOUTS[layout])
+    in_memory = _parse(raw, False, monkeypatch)
+    streamed = _parse(raw, True, monkeypatch)
+    assert data.dataset_frequency(streamed) == data.dataset_frequency(in_memory)
+
+    annual_memory = data.resample_dataset(in_memory, "Y")
+    annual_streamed = data.resample_dataset(streamed, "Y")
+    pd.testing.assert_index_equal(annual_streamed.index, annual_memory.index)
+    for col in annual_memory.columns:
+        np.testing.assert_allclose(annual_streamed[col], annual_memory[col], rtol=1e-6)
+
+    trends_memory = analyze_trends(in_memory, "반도체", 2023)
+    trends_streamed = analyze_trends(streamed, "반도체", 2023)
+    assert trends_streamed == pytest.approx(trends_memory, rel=1e-6, nan_ok=True)
+
+
+def test_streaming_annualizes_partial_year(monkeypatch):
+    streamed = _parse(_monthly_csv(PERIOD_LAYOUTS["연월"]), True, monkeypatch)
+    annual = data.resample_dataset(streamed, "Y")
+    assert annual.loc[2025, "반도체_생산(조원)"] == pytest.approx(360.0)
+    assert analyze_trends(streamed, "반도체", 2023)["production_cagr"] == pytest.approx(0.0)
+
+
+@pytest.mark.parametrize(
+    "header, canonical",
+    [
+        ("기준 연도", "연도"),
+        ("반도체 생산 (조 원)", "반도체_생산(조원)"),
+        ("반도체_수출(억달러)", "반도체_수출(억불)"),
+        ("디스플레이 수출 (억 USD)", "디스플레이_수출(억불)"),
+        ("반도체 시장 점유율(%)", "반도체_시장점유율(퍼센트)"),
+        ("디스플레이_생산액(조원)", "디스플레이_생산(조원)"),
+        ("액정표시장치[LCD] 평균가격($)", "액정표시장치(LCD)_평균가격(달러)"),
+    ],
+)
+def test_match_headers_forgives_spacing_brackets_and_unit_aliases(header, canonical):
+    renamed, rejected = data.match_headers([header])
+    assert renamed == {header: canonical}
+    assert rejected == {}
+
+
+@pytest.mark.parametrize(
+    "header, canonical",
+    [
+        ("반도체_수입(억불)", "반도체_수출(억불)"),
+        ("디스플레이_수입(억불)", "디스플레이_수출(억불)"),
+        ("반도체_생산(억원)", "반도체_생산(조원)"),
+        ("디스플레이 생산(억원)", "디스플레이_생산(조원)"),
+    ],
+)
+def test_match_headers_rejects_different_metric_or_unit(header, canonical):
+    renamed, rejected = data.match_headers(["연도", header])
+    assert renamed == {}
+    assert canonical in rejected[header]
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_rejected_headers_are_reported_and_not_renamed(streaming, monkeypatch):
+    raw = "연도,반도체_생산(조원),반도체_생산(억원),반도체_수입(억불)\n2023,1,10000,2\n2024,2,20000,3\n".encode("utf-8")
+    df = _parse(raw, streaming, monkeypatch)
+    assert df["반도체_생산(조원)"].tolist() == [1, 2]
+    assert "반도체_수출(억불)" not in df.columns
+    assert set(df.attrs["validation_report"]["rejected_columns"]) == {"반도체_생산(억원)", "반도체_수입(억불)"}
+
+
+def _single_column(values):
+    return pd.DataFrame({"x": np.array(values, dtype=np.float64)}, index=pd.Index(range(2000, 2000 + len(values)), name="연도"))
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        # 단위 오타 한 건은 올라갈 때와 내려올 때 두 번의 변화로 잡힌다.
+        ([250, 270, 290, 310, 3300, 330, 350, 370, 390], 2),
+        ([5, 5, 5, 5, 500, 5, 5], 2),
+        ([250, 270, 290, 310, 330, 350, 370, 390], 0),
+        ([5, 5, 5, 5, 5, 5], 0),
+        ([100, 103, 99, 104, 101, 98, 102, 100], 0),
+    ],
+)
+def test_validate_dataset_flags_single_spike(values, expected):
+    report = data.validate_dataset(_single_column(values))
+    assert report["columns"]["x"]["outliers"] == expected
+
+
+@pytest.mark.parametrize(
+    "values, dtype",
+    [
+        ([1.5, 2.25, 12.3, np.nan], np.float32),
+        ([12345678.5, 1.0], np.float64),
+        ([1 / 3, 2.0], np.float64),
+    ],
+)
+def test_compact_float_keeps_csv_decimals(values, dtype):
+    compact = data._compact_float(pd.Series(values))
+    assert compact.dtype == dtype
+    decimals = data._decimal_places(np.array(values))
+    if decimals is not None:
+        np.testing.assert_array_equal(np.round(compact.to_numpy(dtype=np.float64), decimals), np.round(values, decimals))
+
+
+def test_sidecar_keeps_per_column_dtypes(tmp_path):
+    path = tmp_path / "stats.csv"
+    path.write_text("연도,반도체_생산(조원),반도체_수출(억불)\n2023,1.5,12345678.5\n2024,2.25,12345679.5\n", encoding="utf-8")
+    key = data._file_cache_key(str(path))
+    parsed, _ = data._load_default_dataset(str(path), key)
+    assert (tmp_path / ("stats.csv" + data.SIDECAR_SUFFIX)).exists()
+    reloaded, _ = data._load_default_dataset(str(path), key)
+    assert reloaded.dtypes.tolist() == [np.float32, np.float64]
+    pd.testing.assert_frame_equal(reloaded, parsed, check_index_type=False)
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_cp949_after_sniffed_prefix_falls_back(streaming, monkeypatch):
+    # 판별 구간('year,')은 ASCII라 UTF-8로 판별되지만, 그 뒤 한글 헤더·값은 CP949다.
+    raw = "year,반도체_생산(조원),비고\n2023,1.5,잠정\n2024,2.5,확정\n".encode("cp949")
+    monkeypatch.setattr(data, "ENCODING_SNIFF_BYTES", len("year,"))
+    df = _parse(raw, streaming, monkeypatch)
+    assert df["반도체_생산(조원)"].tolist() == [1.5, 2.5]
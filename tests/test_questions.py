@@ -0,0 +1,45 @@
+"""면접 질문 은행: TF-IDF 색인과 개인화 순위 테스트"""
+
+import numpy as np
+
+from k_career_navigator import recommend
+from k_career_navigator.questions import QUESTION_BANK, WILDCARD, QuestionBank, _bit_positions
+
+
+def test_tfidf_handles_empty_rows():
+    # 색인어가 하나도 없는 질문('?')이 가운데와 맨 끝에 있어도 행 정규화가 깨지지 않는다.
+    bank = QuestionBank(
+        [
+            {"question": "DRAM 공정 질문"},
+            {"question": "?"},
+            {"question": "OLED 공정 질문"},
+            {"question": "?"},
+        ]
+    )
+    norms = [np.linalg.norm(bank.data[start:end]) for start, end in zip(bank.indptr[:-1], bank.indptr[1:])]
+    np.testing.assert_allclose(norms, [1.0, 0.0, 1.0, 0.0])
+    scores = bank.similarity("DRAM")
+    assert scores[0] > 0 and scores[1] == scores[3] == 0.0
+
+
+def test_personalize_related_questions_stay_in_industry():
+    for industry in recommend.INDUSTRY_OPTIONS:
+        allowed = set(_bit_positions(QUESTION_BANK.index["industry"].get(industry, 0) | QUESTION_BANK.index["industry"][WILDCARD]))
+        for sub_industry in recommend.SUB_INDUSTRY_OPTIONS[industry]:
+            for job_role in recommend.JOB_ROLE_OPTIONS:
+                selected = set(QUESTION_BANK.sample_ids(industry, sub_industry, job_role))
+                result = QUESTION_BANK.personalize(industry, sub_industry, job_role, f"{job_role} {sub_industry} 공정 수율")
+                related = [QUESTION_BANK.questions.index(question) for question in result["related_questions"]]
+                assert set(related) <= allowed - selected
+
+
+def test_sample_ids_match_survey_tags_and_are_stable():
+    bank = QuestionBank(
+        [{"question": f"반도체 질문 {i}", "industry": "반도체", "role": WILDCARD} for i in range(8)]
+        + [{"question": "디스플레이 질문", "industry": "디스플레이"}, {"question": "공통 질문", "industry": WILDCARD}]
+    )
+    selected = bank.sample_ids("반도체", None, "공정", n=5)
+    assert len(selected) == 5 and list(selected) == sorted(selected)
+    assert 8 not in selected
+    assert bank.sample_ids("반도체", None, "공정", n=5) == selected
+    assert bank.sample_ids("디스플레이", None, None) == (8, 9)
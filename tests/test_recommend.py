@@ -0,0 +1,76 @@
+"""추천 결정 테이블·압축 테이블이 규칙 평가와 같은 결과를 내는지 확인"""
+
+import itertools
+
+import pytest
+
+from k_career_navigator import recommend
+from k_career_navigator.cache import register_dataset
+from k_career_navigator.data import create_dummy_data
+from k_career_navigator.trends import analyze_trends, describe_market, forecast_industry
+
+START_YEAR = 2020
+
+
+def _all_surveys(industry):
+    options = (
+        recommend.SUB_INDUSTRY_OPTIONS[industry],
+        recommend.STATUS_OPTIONS,
+        recommend.MAJOR_OPTIONS,
+        recommend.JOB_ROLE_OPTIONS,
+        recommend.STRENGTH_OPTIONS,
+        recommend.BIZ_TALK_OPTIONS,
+        recommend.THEORY_LEVEL_OPTIONS,
+    )
+    for combo in itertools.product(*options):
+        yield dict(zip(recommend.SURVEY_FIELDS, (industry,) + combo))
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    df = create_dummy_data()
+    register_dataset(df, ("test-dummy",))
+    return df
+
+
+def test_table_matches_rule_evaluation_for_every_survey(dataset):
+    table = recommend.build_recommendation_table(dataset, START_YEAR)
+    checked = 0
+    for industry in recommend.INDUSTRY_OPTIONS:
+        trends = analyze_trends(dataset, industry, START_YEAR)
+        trends.update(forecast_industry(dataset, industry, START_YEAR))
+        market = {
+            "market_summary": describe_market(trends),
+            "market_outlook": describe_market(trends, use_forecast=True),
+        }
+        for survey in _all_surveys(industry):
+            expected = {**market, **recommend._profile_from_rules(*(survey[field] for field in recommend.SURVEY_FIELDS))}
+            looked_up = table.lookup(recommend.survey_option_ids(survey))
+            assert looked_up == expected
+            assert list(looked_up) == list(expected)
+            assert recommend.generate_recommendation(trends, survey) == expected
+            checked += 1
+    assert checked == 25_920
+
+
+@pytest.mark.parametrize(
+    "survey",
+    [
+        {
+            "industry": "반도체",
+            "sub_industry": recommend.SUB_INDUSTRY_OPTIONS["반도체"][0],
+            "status": recommend.STATUS_OPTIONS[0],
+            "job_role": recommend.JOB_ROLE_OPTIONS[0],
+            "strength": "해외 경험",
+        },
+        {"industry": "배터리", "sub_industry": "양극재", "status": "재학생", "major": "화학공학", "job_role": "연구개발"},
+        {},
+    ],
+)
+def test_profile_cache_matches_rule_evaluation_off_options(survey):
+    expected = recommend._profile_from_rules(*(survey.get(field) for field in recommend.SURVEY_FIELDS))
+    first = recommend.recommendation_profile(survey)
+    assert first == expected
+    # 캐시 적중 결과도 같고, 호출자가 받은 리스트를 고쳐도 캐시는 변하지 않는다.
+    first["complement_tips"].append("변경")
+    assert recommend.recommendation_profile(survey) == expected
@@ -0,0 +1,24 @@
+"""근무지 위치 문구 해석·통근권 테스트"""
+
+from k_career_navigator.regions import OTHER_ZONE, Site, commute_zone, format_site, parse_location
+
+
+def test_parse_location_infers_provinces_and_aliases():
+    assert parse_location("경기 화성(DSR/Line), 평택(고덕), 충북 청주(흥덕구 - NAND)") == [
+        Site("경기", "화성", "DSR/Line"),
+        Site("경기", "평택", "고덕"),
+        Site("충북", "청주", "흥덕구 - NAND"),
+    ]
+    # 통칭 지명은 시/군/구 + 사업장으로 정규화하고, 시/도는 지명 사전이 앞에 적힌 시/도보다 우선한다.
+    assert parse_location("충남 판교, 온양(배방읍)") == [Site("경기", "성남", "판교"), Site("충남", "아산", "온양 배방읍")]
+    assert parse_location("서울") == [Site("서울", "", "")]
+    assert format_site(Site("경기", "화성", "동탄")) == "경기 화성 (동탄)"
+
+
+def test_unknown_regions_are_skipped_or_other_zone():
+    assert parse_location("미국 오스틴, 텍사스(오스틴)") == []
+    assert parse_location(None) == [] and parse_location("") == []
+    # 사전에 없는 지명은 직전 구간의 시/도를 따른다.
+    assert parse_location("경기 화성, 안성") == [Site("경기", "화성", ""), Site("경기", "안성", "")]
+    assert commute_zone("제주") == OTHER_ZONE and commute_zone("") == OTHER_ZONE
+    assert commute_zone("세종") == "충청권"
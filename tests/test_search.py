@@ -0,0 +1,28 @@
+"""BM25 문자 2-gram 검색 테스트"""
+
+from k_career_navigator.search import SearchIndex, search_catalog
+
+DOCUMENTS = [
+    {"kind": "기업", "title": "SK하이닉스", "text": "메모리 / 경기 이천, 충북 청주"},
+    {"kind": "기업", "title": "DB하이텍", "text": "파운드리 / 경기 부천"},
+    {"kind": "면접 질문", "title": "면접 질문", "text": "이천 공장의 HBM 패키징 공정을 설명해 보세요."},
+]
+
+
+def test_search_ranks_documents_covering_all_query_terms_first():
+    index = SearchIndex(DOCUMENTS)
+    results = index.search("하이닉스 이천")
+    assert [r["document"]["title"] for r in results][0] == "SK하이닉스"
+    assert {r["document"]["title"] for r in results} == {"SK하이닉스", "DB하이텍", "면접 질문"}
+    assert [r["score"] for r in results] == sorted((r["score"] for r in results), reverse=True)
+    assert [r["document"]["kind"] for r in index.search("이천", kind="면접 질문")] == ["면접 질문"]
+    assert "이천" in results[0]["snippet"]
+
+
+def test_search_empty_or_unknown_query_returns_nothing():
+    index = SearchIndex(DOCUMENTS)
+    assert index.search("") == []
+    assert index.search("   ") == []
+    assert index.search("없는단어") == []
+    assert search_catalog("") == []
+    assert SearchIndex([]).search("하이닉스") == []
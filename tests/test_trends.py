@@ -0,0 +1,138 @@
+"""추세 분석 테스트: 추세 인덱스 연도 행 추가, 부트스트랩 구간, 전망, 선후행 요약, 국면 타임라인"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from k_career_navigator.data import create_dummy_data, load_dataset
+from k_career_navigator.trends import (
+    REGIME_ROLLING_YEARS,
+    TrendIndex,
+    append_year_rows,
+    bootstrap_cagr_intervals,
+    forecast_industry,
+    get_trend_index,
+    lead_lag_summary,
+    regime_timeline,
+)
+
+
+def test_trend_index_rejects_duplicate_year():
+    df = create_dummy_data()
+    index = TrendIndex(df)
+    last_year = int(df.index[-1])
+    with pytest.raises(ValueError):
+        index.append(last_year, np.ones(len(index.columns)))
+    with pytest.raises(ValueError):
+        index.append(last_year - 1, np.ones(len(index.columns)))
+    index.append(last_year + 1, np.ones(len(index.columns)))
+    assert index.latest.tolist() == [1.0] * len(index.columns)
+
+
+@pytest.mark.parametrize("years", [[2024], [2025, 2025], [2026, 2025, 2026]])
+def test_append_year_rows_rejects_overlapping_years(years):
+    df = create_dummy_data()
+    index = get_trend_index(df)
+    new_rows = pd.DataFrame({"연도": years, "반도체_생산(조원)": [1.0] * len(years)})
+    with pytest.raises(ValueError):
+        append_year_rows(df, new_rows)
+    # 거부된 추가는 기존 추세 인덱스를 건드리지 않는다.
+    assert get_trend_index(df) is index
+
+
+def test_append_year_rows_matches_rebuilt_index():
+    df = create_dummy_data()
+    new_rows = pd.DataFrame({"연도": [2025, 2026], "반도체_생산(조원)": [150.0, 160.0]})
+    combined = append_year_rows(df, new_rows)
+    rebuilt = TrendIndex(combined)
+    updated = get_trend_index(combined)
+    for start_year in (2015, 2020, 2025):
+        for field, values in rebuilt.window(start_year).items():
+            np.testing.assert_allclose(updated.window(start_year)[field], values, equal_nan=True)
+
+
+def _industry_frame(years, production, export, price):
+    return pd.DataFrame(
+        {"반도체_생산(조원)": production, "반도체_수출(억불)": export, "DRAM_가격(달러)": price},
+        index=pd.Index(years, name="연도"),
+    )
+
+
+def test_lead_lag_summary_reports_no_relation_for_noise():
+    rng = np.random.default_rng(7)
+    years = np.arange(1995, 2025)
+    levels = [100 * np.exp(np.cumsum(rng.normal(0, 0.1, len(years)))) for _ in range(3)]
+    lines = lead_lag_summary(_industry_frame(years, *levels), "반도체")
+    assert len(lines) == 2 and all("뚜렷한 선후행 없음" in line for line in lines)
+    # 내장 더미 데이터도 잡음이므로 선후행을 주장하지 않는다.
+    assert all("뚜렷한 선후행 없음" in line for line in lead_lag_summary(create_dummy_data(), "반도체"))
+
+
+def test_lead_lag_summary_detects_price_leading_volume():
+    rng = np.random.default_rng(11)
+    years = np.arange(1995, 2025)
+    price_growth = rng.normal(0, 0.1, len(years))
+    # 물량 변화율 = 1년 전 가격 변화율 + 작은 잡음
+    volume_growth = np.roll(price_growth, 1) + rng.normal(0, 0.01, len(years))
+    price = 100 * np.exp(np.cumsum(price_growth))
+    volume = 100 * np.exp(np.cumsum(volume_growth))
+    lines = lead_lag_summary(_industry_frame(years, volume, volume * 2, price), "반도체")
+    assert all("가격이 1년 선행" in line for line in lines)
+
+
+@pytest.mark.parametrize("gap", ["nan_price", "missing_year"])
+def test_regime_timeline_matches_dashboard_window_cagr(gap):
+    df = create_dummy_data()
+    if gap == "nan_price":
+        df.loc[2020, "DRAM_가격(달러)"] = np.nan
+    else:
+        df = df.drop(index=2018)
+    timeline = regime_timeline(df, "반도체")
+    assert "판단 불가" not in set(timeline["label"])
+    for end_year, row in timeline.iterrows():
+        index = TrendIndex(df.loc[end_year - REGIME_ROLLING_YEARS : end_year])
+        window = index.window(end_year - REGIME_ROLLING_YEARS)
+        columns = list(index.columns)
+        assert row["production_cagr"] == pytest.approx(window["cagr"][columns.index("반도체_생산(조원)")])
+        assert row["price_cagr"] == pytest.approx(window["cagr"][columns.index("DRAM_가격(달러)")])
+
+
+def test_append_year_rows_replaces_cached_dataset():
+    df, _ = load_dataset()
+    combined = append_year_rows(df, pd.DataFrame({"연도": [int(df.index[-1]) + 1], "반도체_생산(조원)": ["1,234.5"]}))
+    reloaded, _ = load_dataset()
+    assert reloaded is combined
+    assert reloaded["반도체_생산(조원)"].iloc[-1] == pytest.approx(1234.5)
+
+
+def _geometric_frame(growth=0.1, years=range(2015, 2025)):
+    years = np.array(list(years))
+    values = 100 * (1 + growth) ** (years - years[0])
+    return pd.DataFrame({"반도체_생산(조원)": values, "DRAM_가격(달러)": values / 10}, index=pd.Index(years, name="연도"))
+
+
+def test_bootstrap_intervals_bracket_point_cagr_with_nan_endpoints():
+    exact = bootstrap_cagr_intervals(_geometric_frame(), 2015)
+    np.testing.assert_allclose(exact["low"], 0.1)
+    np.testing.assert_allclose(exact["high"], 0.1)
+
+    df = create_dummy_data()
+    df.loc[2020, "DRAM_가격(달러)"] = np.nan
+    df.loc[2024, "DRAM_가격(달러)"] = np.nan
+    intervals = bootstrap_cagr_intervals(df, 2020)
+    point = TrendIndex(df).window(2020)["cagr"]
+    assert np.all(np.isfinite(intervals["low"])) and np.all(np.isfinite(intervals["high"]))
+    assert np.all((intervals["low"] <= point + 1e-12) & (point <= intervals["high"] + 1e-12))
+
+
+def test_forecast_extends_log_linear_trend_ignoring_missing_values():
+    df = _geometric_frame()
+    df.loc[2015, "반도체_생산(조원)"] = np.nan
+    df.loc[2024, "DRAM_가격(달러)"] = np.nan
+    forecast = forecast_industry(df, "반도체", 2015)
+    assert forecast["forecast_years"] == [2025, 2026, 2027]
+    assert forecast["production_forecast_cagr"] == pytest.approx(0.1)
+    assert forecast["price_forecast_cagr"] == pytest.approx(0.1)
+    expected = [100 * 1.1**n for n in (10, 11, 12)]
+    assert forecast["production_forecast"] == pytest.approx(expected)
+    assert forecast_industry(df.loc[[2024]], "반도체", 2015) == {}